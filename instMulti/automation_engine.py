@@ -6,6 +6,8 @@
 import asyncio
 import random
 import logging
+import queue
+import threading
 import time
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timedelta
@@ -1059,15 +1061,17 @@ class InstagramAutomation:
     
     async def safe_sleep(self, duration: float):
         """Безпечна затримка з перевіркою стану"""
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            if not self.running:
-                break
-            
+        # Монотонний дедлайн: переведення системного годинника не впливає на затримку,
+        # а останній відрізок скорочується до залишку замість перебору на цілий крок
+        deadline = time.monotonic() + duration
+        while self.running:
             while self.paused:
                 await asyncio.sleep(0.1)
             
-            await asyncio.sleep(0.1)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, 0.1))
     
     def stop(self):
         """Зупинка автоматизації"""
@@ -1089,15 +1093,65 @@ class InstagramAutomation:
         return stats
 
 
+class _DaemonPool:
+    """Обмежений пул потоків-демонів: потоки створюються за потребою і живуть між запусками,
+    але, на відміну від ThreadPoolExecutor, не затримують вихід з програми"""
+    
+    def __init__(self, max_workers: int, name: str):
+        self._max_workers = max_workers
+        self._name = name
+        self._jobs = queue.Queue()
+        self._threads = []
+        self._idle = 0  # Вільні потоки, яким ще не призначено роботу
+        self._backlog = 0  # Завдання в черзі, для яких не знайшлося вільного потоку
+        self._lock = threading.Lock()
+    
+    def submit(self, fn: Callable, *args):
+        with self._lock:
+            self._jobs.put((fn, args))
+            if self._idle:
+                self._idle -= 1
+            elif len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._worker, name=f"{self._name}-{len(self._threads)}",
+                                          daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._backlog += 1
+    
+    def _worker(self):
+        while True:
+            fn, args = self._jobs.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                logging.error(f"Помилка завдання пулу {self._name}: {e}")
+            with self._lock:
+                # Звільнений потік спершу забирає завдання, що чекали в черзі
+                if self._backlog:
+                    self._backlog -= 1
+                else:
+                    self._idle += 1
+
+
 class MultiWorkerManager:
     """Менеджер для координації роботи кількох воркерів"""
     
+    # Спільний пул для запусків: потік не створюється на кожен старт. Два потоки -
+    # щоб новий запуск не чекав, поки попередній після stop закриває браузер
+    _pool = _DaemonPool(max_workers=2, name='ig-automation')
+    
     def __init__(self):
         self.workers = []
         self.running = False
         self.paused = False
         self.config = None
         self.status_callback = None
+        # Подія "не на паузі" живе в циклі потоку автоматизації: воркери чекають її
+        # без опитування, а GUI-потік перемикає через call_soon_threadsafe
+        self._loop = None
+        self._resume = None
+        self._automations = []  # Активні InstagramAutomation воркерів: stop зупиняє і їх
     
     def start_automation(self, config: Dict[str, Any], status_callback: Callable = None):
         """Запуск мультиворкер автоматизації"""
@@ -1106,10 +1160,8 @@ class MultiWorkerManager:
         self.running = True
         self.paused = False
         
-        # Запуск в окремому потоці
-        import threading
-        thread = threading.Thread(target=self._run_automation_sync, daemon=True)
-        thread.start()
+        # Запуск у потоці зі спільного пулу
+        self._pool.submit(self._run_automation_sync)
     
     def _run_automation_sync(self):
         """Синхронний запуск автоматизації"""
@@ -1128,6 +1180,11 @@ class MultiWorkerManager:
     
     async def _run_automation_async(self):
         """Асинхронний запуск автоматизації"""
+        self._loop = asyncio.get_running_loop()
+        self._resume = asyncio.Event()
+        if not self.paused:
+            self._resume.set()
+        
         try:
             accounts = self.config['accounts']
             targets = self.config['targets']
@@ -1197,14 +1254,16 @@ class MultiWorkerManager:
             }
             
             async with InstagramAutomation(automation_config) as automation:
-                automation.running = True
+                automation.running = self.running
+                self._automations.append(automation)
                 
                 for account in accounts:
                     if not self.running:
                         break
                     
-                    while self.paused:
-                        await asyncio.sleep(1)
+                    await self._resume.wait()
+                    if not self.running:
+                        break
                     
                     try:
                         # Запуск автоматизації для акаунту
@@ -1231,18 +1290,34 @@ class MultiWorkerManager:
             if self.status_callback:
                 self.status_callback(worker_id, 'idle')
     
+    def _set_resume(self, resumed: bool):
+        """Перемикання події продовження з будь-якого потоку"""
+        loop, event = self._loop, self._resume
+        if loop is None or event is None:
+            return  # Цикл ще не стартував - стан візьметься з self.paused
+        try:
+            loop.call_soon_threadsafe(event.set if resumed else event.clear)
+        except RuntimeError:
+            pass  # Цикл уже закрито
+    
     def stop_automation(self):
         """Зупинка автоматизації"""
         self.running = False
         self.paused = False
+        # Цикл цілей і safe_sleep перевіряють прапорець самої автоматизації
+        for automation in self._automations:
+            automation.running = False
+        self._set_resume(True)  # Розблоковує воркерів на паузі, щоб вони побачили stop
     
     def pause_automation(self):
         """Пауза автоматизації"""
         self.paused = True
+        self._set_resume(False)
     
     def resume_automation(self):
         """Продовження автоматизації"""
         self.paused = False
+        self._set_resume(True)
     
     def is_running(self) -> bool:
         """Перевірка чи працює автоматизація"""
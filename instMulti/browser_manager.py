@@ -7,6 +7,7 @@
 import asyncio
 import logging
 import random
+import time
 import json
 import aiohttp
 from typing import Dict, List, Any, Optional
@@ -318,6 +319,10 @@ class ChromeBrowserManager(BaseBrowserManager):
 class DolphinBrowserManager(BaseBrowserManager):
     """Менеджер для Dolphin Anty браузера"""
     
+    # Успішні перевірки API: (api_url, token) -> час перевірки; спільні для всіх воркерів
+    _probe_cache: Dict[tuple, float] = {}
+    PROBE_TTL = 120
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.dolphin_settings = config.get('dolphin_settings', {})
@@ -325,6 +330,19 @@ class DolphinBrowserManager(BaseBrowserManager):
         self.token = self.dolphin_settings.get('token', '')
         self.profiles = {}
         self.playwright = None
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _http(self) -> aiohttp.ClientSession:
+        """Спільна HTTP-сесія до Dolphin API (keep-alive між запитами)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def cleanup(self):
+        """Очищення ресурсів разом з HTTP-сесією"""
+        await super().cleanup()
+        if self._session and not self._session.closed:
+            await self._session.close()
         
     async def initialize(self):
         """Ініціалізація Dolphin API"""
@@ -344,12 +362,20 @@ class DolphinBrowserManager(BaseBrowserManager):
             return False
     
     async def _check_dolphin_connection(self) -> bool:
-        """Перевірка з'єднання з Dolphin API"""
+        """Перевірка з'єднання з Dolphin API (успішний результат кешується на PROBE_TTL секунд)"""
+        key = (self.api_url, self.token)
+        checked_at = self._probe_cache.get(key)
+        if checked_at is not None and time.monotonic() - checked_at < self.PROBE_TTL:
+            return True
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.token}'}
-                async with session.get(f'{self.api_url}/browser_profiles', headers=headers, timeout=10) as response:
-                    return response.status == 200
+            session = self._http()
+            headers = {'Authorization': f'Bearer {self.token}'}
+            async with session.get(f'{self.api_url}/browser_profiles', headers=headers, timeout=10) as response:
+                if response.status == 200:
+                    self._probe_cache[key] = time.monotonic()
+                    return True
+                return False
         except Exception as e:
             logging.error(f"Помилка з'єднання з Dolphin: {e}")
             return False
@@ -463,26 +489,26 @@ class DolphinBrowserManager(BaseBrowserManager):
                     logging.info(f"Додано проксі до профілю {profile_name}: {proxy}")
             
             # Створення профілю
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {self.token}',
-                    'Content-Type': 'application/json'
-                }
+            session = self._http()
+            headers = {
+                'Authorization': f'Bearer {self.token}',
+                'Content-Type': 'application/json'
+            }
                 
-                async with session.post(
-                    f'{self.api_url}/browser_profiles',
-                    headers=headers,
-                    json=profile_data
-                ) as response:
-                    if response.status == 201:
-                        result = await response.json()
-                        profile_id = result['id']
-                        logging.info(f"Створено Dolphin профіль {profile_id} для {account_username}")
-                        return profile_id
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Помилка створення профілю: {error_text}")
-                        return None
+            async with session.post(
+                f'{self.api_url}/browser_profiles',
+                headers=headers,
+                json=profile_data
+            ) as response:
+                if response.status == 201:
+                    result = await response.json()
+                    profile_id = result['id']
+                    logging.info(f"Створено Dolphin профіль {profile_id} для {account_username}")
+                    return profile_id
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Помилка створення профілю: {error_text}")
+                    return None
             
         except Exception as e:
             logging.error(f"Помилка отримання/створення профілю для {account_username}: {e}")
@@ -491,16 +517,16 @@ class DolphinBrowserManager(BaseBrowserManager):
     async def _find_profile_by_name(self, profile_name: str) -> Optional[Dict]:
         """Пошук профілю за назвою"""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.token}'}
-                async with session.get(f'{self.api_url}/browser_profiles', headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        profiles = data.get('data', [])
+            session = self._http()
+            headers = {'Authorization': f'Bearer {self.token}'}
+            async with session.get(f'{self.api_url}/browser_profiles', headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    profiles = data.get('data', [])
                         
-                        for profile in profiles:
-                            if profile.get('name') == profile_name:
-                                return profile
+                    for profile in profiles:
+                        if profile.get('name') == profile_name:
+                            return profile
                         
         except Exception as e:
             logging.error(f"Помилка пошуку профілю {profile_name}: {e}")
@@ -514,25 +540,25 @@ class DolphinBrowserManager(BaseBrowserManager):
             if not proxy_config:
                 return False
             
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {self.token}',
-                    'Content-Type': 'application/json'
-                }
+            session = self._http()
+            headers = {
+                'Authorization': f'Bearer {self.token}',
+                'Content-Type': 'application/json'
+            }
                 
-                update_data = {'proxy': proxy_config}
+            update_data = {'proxy': proxy_config}
                 
-                async with session.patch(
-                    f'{self.api_url}/browser_profiles/{profile_id}',
-                    headers=headers,
-                    json=update_data
-                ) as response:
-                    if response.status == 200:
-                        logging.info(f"Оновлено проксі для профілю {profile_id}")
-                        return True
-                    else:
-                        logging.error(f"Помилка оновлення проксі профілю {profile_id}")
-                        return False
+            async with session.patch(
+                f'{self.api_url}/browser_profiles/{profile_id}',
+                headers=headers,
+                json=update_data
+            ) as response:
+                if response.status == 200:
+                    logging.info(f"Оновлено проксі для профілю {profile_id}")
+                    return True
+                else:
+                    logging.error(f"Помилка оновлення проксі профілю {profile_id}")
+                    return False
                         
         except Exception as e:
             logging.error(f"Помилка оновлення проксі: {e}")
@@ -574,20 +600,20 @@ class DolphinBrowserManager(BaseBrowserManager):
     async def _start_profile(self, profile_id: str) -> Optional[Dict]:
         """Запуск профілю Dolphin"""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.token}'}
-                async with session.get(
-                    f'{self.api_url}/browser_profiles/{profile_id}/start',
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logging.info(f"Профіль {profile_id} запущено")
-                        return data
-                    else:
-                        error_text = await response.text()
-                        logging.error(f"Помилка запуску профілю {profile_id}: {error_text}")
-                        return None
+            session = self._http()
+            headers = {'Authorization': f'Bearer {self.token}'}
+            async with session.get(
+                f'{self.api_url}/browser_profiles/{profile_id}/start',
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    logging.info(f"Профіль {profile_id} запущено")
+                    return data
+                else:
+                    error_text = await response.text()
+                    logging.error(f"Помилка запуску профілю {profile_id}: {error_text}")
+                    return None
                         
         except Exception as e:
             logging.error(f"Помилка запуску профілю {profile_id}: {e}")
@@ -636,16 +662,16 @@ class DolphinBrowserManager(BaseBrowserManager):
     async def _stop_profile(self, profile_id: str):
         """Зупинка профілю Dolphin"""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.token}'}
-                async with session.get(
-                    f'{self.api_url}/browser_profiles/{profile_id}/stop',
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        logging.info(f"Профіль {profile_id} зупинено")
-                    else:
-                        logging.error(f"Помилка зупинки профілю {profile_id}")
+            session = self._http()
+            headers = {'Authorization': f'Bearer {self.token}'}
+            async with session.get(
+                f'{self.api_url}/browser_profiles/{profile_id}/stop',
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    logging.info(f"Профіль {profile_id} зупинено")
+                else:
+                    logging.error(f"Помилка зупинки профілю {profile_id}")
                         
         except Exception as e:
             logging.error(f"Помилка зупинки профілю {profile_id}: {e}")
@@ -10,8 +10,55 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import shutil
+import tempfile
 from pathlib import Path
 
+# Швидка серіалізація JSON (orjson, якщо встановлено); файли читаються і пишуться як байти UTF-8
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _dumps_compact = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _dumps_compact(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    _loads = json.loads
+
+
+# Маска прав процесу: нові файли отримують ті ж права, що й при звичайному open()
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_atomic(path, data):
+    """Запис байтів одним write() у тимчасовий файл поруч з атомарною заміною"""
+    # NamedTemporaryFile створює файл з правами 0600 - зберігаємо права замінюваного файлу
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or '.', delete=False, buffering=0) as f:
+        try:
+            f.write(data)
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    try:
+        os.chmod(f.name, mode)
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
 
 class DataManager:
     """Централізований менеджер для всіх даних програми"""
@@ -371,8 +418,7 @@ class DataManager:
                 shutil.copy2(filepath, backup_path)
             
             # Збереження нових даних
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_atomic(filepath, _dumps(data))
                 
         except Exception as e:
             logging.error(f"Помилка збереження {filename}: {e}")
@@ -383,8 +429,8 @@ class DataManager:
             filepath = os.path.join(self.data_dir, filename)
             
             if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(filepath, 'rb') as f:
+                    return _loads(f.read())
                     
         except Exception as e:
             logging.error(f"Помилка завантаження {filename}: {e}")
@@ -421,8 +467,8 @@ class DataManager:
             else:
                 raise ValueError(f"Невідомий тип експорту: {data_type}")
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(export_data))
             
             logging.info(f"Дані експортовано: {filepath}")
             return filepath
@@ -438,8 +484,8 @@ class DataManager:
                 logging.error(f"Файл не знайдено: {filepath}")
                 return False
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
             
             if data_type == "all":
                 if isinstance(data, dict):
@@ -514,8 +560,8 @@ class DataManager:
                 "statistics": self.statistics
             }
             
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            with open(backup_path, 'wb') as f:
+                f.write(_dumps(backup_data))
             
             logging.info(f"Створено повний бекап: {backup_path}")
             return backup_path
@@ -6,8 +6,10 @@ Instagram Bot Pro v3.0 - Повний GUI з реальною автоматиз
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import json
+import logging
+import mmap
 import os
+import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import threading
@@ -15,13 +17,15 @@ import asyncio
 import queue
 import sys
 import traceback
+from itertools import compress, islice
+from dataclasses import dataclass
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Імпорт модулів для реальної автоматизації
 try:
     from config import BotConfig
-    from automation_engine import MultiWorkerManager, InstagramAutomation
-    from data_manager_final import DataManager
-    from browser_manager import BrowserFactory
+    from data_manager_final import DataManager, _dumps, _dumps_compact, _loads, _write_atomic
     print("🤖 Модулі реальної автоматизації завантажено успішно")
     REAL_AUTOMATION = True
 except ImportError as e:
@@ -29,10 +33,7 @@ except ImportError as e:
     print("💡 Встановіть залежності: pip install playwright && playwright install chromium")
     # Створення заглушок для відсутніх модулів
     BotConfig = None
-    MultiWorkerManager = None
-    InstagramAutomation = None
     DataManager = None
-    BrowserFactory = None
     REAL_AUTOMATION = False
     exit("❌ Неможливо запустити без необхідних модулів")
 
@@ -44,6 +45,137 @@ except ImportError:
     print("❌ Playwright недоступний")
     exit("❌ Встановіть Playwright: pip install playwright && playwright install chromium")
 
+# Журнал GUI: аргументи форматуються лише для записів, що пройшли рівень
+logger = logging.getLogger('instMulti')
+logger.setLevel(logging.WARNING)
+
+
+# Фонові читання/розбір файлів, щоб не блокувати mainloop
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+# Записи файлів даних ідуть через один потік, тож зберігаються у порядку виклику.
+# Поки запис файлу чекає в черзі, нові знімки лише замінюють його вміст
+_WRITE_POOL = ThreadPoolExecutor(max_workers=1)
+_PENDING_WRITES = {}
+_PENDING_LOCK = threading.Lock()
+
+
+def _write_latest(path):
+    """Запис найновішого знімка для path (виконується в _WRITE_POOL)"""
+    with _PENDING_LOCK:
+        data = _PENDING_WRITES.pop(path)
+    _write_atomic(path, data if isinstance(data, bytes) else _dumps(data))
+
+
+def _submit_write(path, data):
+    """Постановка запису в чергу; None, якщо знімок приєднано до вже запланованого запису"""
+    with _PENDING_LOCK:
+        queued = path in _PENDING_WRITES
+        _PENDING_WRITES[path] = data
+    if not queued:
+        return _WRITE_POOL.submit(_write_latest, path)
+    return None
+
+
+def _read_json(path):
+    """Читання та розбір JSON-файлу (виконується в _IO_EXECUTOR)"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _when_done(widget, future, callback, interval=30):
+    """Опитування future з головного потоку; callback отримує future після завершення"""
+    def _poll():
+        if future.done():
+            callback(future)
+        else:
+            widget.after(interval, _poll)
+    widget.after(interval, _poll)
+
+
+_MMAP_THRESHOLD = 1_000_000
+
+
+def _iter_text_lines(f):
+    """Рядки відкритого текстового файлу; великі файли читаються через mmap"""
+    size = os.fstat(f.fileno()).st_size
+    if size <= _MMAP_THRESHOLD:
+        yield from f
+        return
+    
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw in iter(mm.readline, b''):
+            yield raw.decode('utf-8', 'ignore')
+
+
+def _parse_accounts_file(filename):
+    """Розбір файлу імпорту у список (username, password, proxy); виконується у фоні"""
+    rows = []
+    with open(filename, 'r', encoding='utf-8') as f:
+        if filename.endswith('.json'):
+            data = _loads(f.read())
+            if isinstance(data, list):
+                for account_data in data:
+                    if isinstance(account_data, dict) and 'username' in account_data and 'password' in account_data:
+                        rows.append((account_data['username'], account_data['password'], account_data.get('proxy')))
+        else:
+            for line in _iter_text_lines(f):
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    # username:password[:proxy], де проксі може містити власні ':'
+                    username, sep, rest = line.partition(':')
+                    if sep:
+                        password, _, proxy = rest.partition(':')
+                        rows.append((username, password, proxy or None))
+    return rows
+
+
+def _format_account_line(account):
+    """Рядок експорту username:password[:proxy]"""
+    line = f"{account['username']}:{account['password']}"
+    if account.get('proxy'):
+        line += f":{account['proxy']}"
+    return line + '\n'
+
+
+def _parse_targets_file(filename):
+    """Розбір файлу імпорту цілей у список username; виконується у фоні"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        if filename.endswith('.json'):
+            data = _loads(f.read())
+            if not isinstance(data, list):
+                return []
+            targets = (str(target).strip().replace('@', '') for target in data)
+        else:
+            targets = (line.strip().replace('@', '') for line in _iter_text_lines(f))
+            targets = (target for target in targets if not target.startswith('#'))
+        return [target for target in targets if target]
+
+
+# Модуль автоматизації тягне за собою браузерний стек, тому імпортується при першому запуску
+_AUTOMATION = None
+
+
+def _automation_engine():
+    """Лінивий імпорт automation_engine"""
+    global _AUTOMATION
+    if _AUTOMATION is None:
+        import automation_engine
+        _AUTOMATION = automation_engine
+    return _AUTOMATION
+
+
+_NEWLINES_TO_SPACES = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Нормалізація username цілі: без '@' та пробільних символів
+_NORMALIZE = re.compile(r'[@\s]')
+
+
+def _shorten(text, width=40):
+    """Обрізання тексту для списку в один рядок"""
+    return (text if len(text) <= width else text[:width] + '...').translate(_NEWLINES_TO_SPACES)
+
 
 class ModernStyle:
     """Сучасна темна тема оформлення"""
@@ -73,6 +205,162 @@ class ModernStyle:
         'small': ('Segoe UI', 9),
         'button': ('Segoe UI', 9, 'bold')
     }
+    
+    # Ті самі значення як атрибути: C.surface замість пошуку в словнику
+    C = SimpleNamespace(**COLORS)
+    F = SimpleNamespace(**FONTS)
+
+
+# Спільні набори опцій віджетів: словники створюються один раз і розпаковуються через **
+CARD_FRAME = {
+    'bg': ModernStyle.COLORS['card'],
+    'relief': 'flat',
+    'bd': 1,
+    'highlightbackground': ModernStyle.COLORS['border'],
+    'highlightthickness': 1
+}
+
+HEADING_CARD = {'font': ModernStyle.FONTS['heading'], 'bg': ModernStyle.COLORS['card'], 'fg': ModernStyle.COLORS['text']}
+HEADING_BG = {'font': ModernStyle.FONTS['heading'], 'bg': ModernStyle.COLORS['background'], 'fg': ModernStyle.COLORS['text']}
+HEADING_SIDEBAR = {'font': ModernStyle.FONTS['heading'], 'bg': ModernStyle.COLORS['sidebar'], 'fg': ModernStyle.COLORS['text']}
+SMALL_SIDEBAR = {'font': ModernStyle.FONTS['small'], 'bg': ModernStyle.COLORS['sidebar'], 'fg': ModernStyle.COLORS['text']}
+SMALL_SIDEBAR_MUTED = {'font': ModernStyle.FONTS['small'], 'bg': ModernStyle.COLORS['sidebar'], 'fg': ModernStyle.COLORS['text_secondary']}
+HEADING_SURFACE = {'font': ModernStyle.FONTS['heading'], 'bg': ModernStyle.COLORS['surface'], 'fg': ModernStyle.COLORS['text']}
+LABEL_CARD = {'font': ModernStyle.FONTS['body'], 'bg': ModernStyle.COLORS['card'], 'fg': ModernStyle.COLORS['text']}
+LABEL_BG = {'font': ModernStyle.FONTS['body'], 'bg': ModernStyle.COLORS['background'], 'fg': ModernStyle.COLORS['text']}
+HINT_BG = {'font': ModernStyle.FONTS['small'], 'bg': ModernStyle.COLORS['background'], 'fg': ModernStyle.COLORS['text_secondary']}
+SMALL_SURFACE = {'font': ModernStyle.FONTS['small'], 'bg': ModernStyle.COLORS['surface'], 'fg': ModernStyle.COLORS['text']}
+SMALL_CARD = {'font': ModernStyle.FONTS['small'], 'bg': ModernStyle.COLORS['card'], 'fg': ModernStyle.COLORS['text']}
+SMALL_CARD_MUTED = {'font': ModernStyle.FONTS['small'], 'bg': ModernStyle.COLORS['card'], 'fg': ModernStyle.COLORS['text_secondary']}
+SPINBOX_SURFACE = {'font': ModernStyle.FONTS['body'], 'bg': ModernStyle.COLORS['surface'], 'fg': ModernStyle.COLORS['text']}
+
+ENTRY_SURFACE = {
+    'font': ModernStyle.FONTS['body'],
+    'bg': ModernStyle.COLORS['surface'],
+    'fg': ModernStyle.COLORS['text'],
+    'insertbackground': ModernStyle.COLORS['text']
+}
+
+TEXT_SURFACE = {
+    'font': ModernStyle.FONTS['body'],
+    'bg': ModernStyle.COLORS['surface'],
+    'fg': ModernStyle.COLORS['text'],
+    'insertbackground': ModernStyle.COLORS['text'],
+    'wrap': tk.WORD
+}
+
+LISTBOX_BG = {
+    'font': ModernStyle.FONTS['body'],
+    'bg': ModernStyle.COLORS['background'],
+    'fg': ModernStyle.COLORS['text'],
+    'selectbackground': ModernStyle.COLORS['primary'],
+    'selectforeground': 'white',
+    'relief': 'flat',
+    'borderwidth': 0
+}
+
+RADIO_SURFACE = {
+    'font': ModernStyle.FONTS['body'],
+    'bg': ModernStyle.COLORS['surface'],
+    'fg': ModernStyle.COLORS['text'],
+    'selectcolor': ModernStyle.COLORS['primary'],
+    'activebackground': ModernStyle.COLORS['surface']
+}
+
+CHECK_CARD = {
+    'font': ModernStyle.FONTS['body'],
+    'bg': ModernStyle.COLORS['card'],
+    'fg': ModernStyle.COLORS['text'],
+    'selectcolor': ModernStyle.COLORS['surface']
+}
+
+ANIMATED_BUTTON = {
+    'relief': 'flat',
+    'borderwidth': 0,
+    'font': ModernStyle.FONTS['button'],
+    'fg': 'white',
+    'activeforeground': 'white',
+    'cursor': 'hand2',
+    'padx': 12,
+    'pady': 6
+}
+
+# ttk-стилі глобальні для процесу, тому налаштовуються один раз
+_STYLE_READY = False
+
+
+def _ensure_styles():
+    """Одноразове налаштування ttk-стилів"""
+    global _STYLE_READY
+    if _STYLE_READY:
+        return
+    
+    style = ttk.Style()
+    style.configure("Treeview", 
+                   background=ModernStyle.COLORS['background'],
+                   foreground=ModernStyle.COLORS['text'],
+                   fieldbackground=ModernStyle.COLORS['background'])
+    style.configure("Treeview.Heading", 
+                   background=ModernStyle.COLORS['card'],
+                   foreground=ModernStyle.COLORS['text'])
+    
+    # Віджети статусу воркерів
+    surface = ModernStyle.COLORS['surface']
+    style.configure("Worker.TFrame", background=surface)
+    style.configure("Worker.Dot.TLabel", background=surface,
+                    foreground=ModernStyle.COLORS['text_secondary'], font=('Arial', 10))
+    style.configure("Worker.Name.TLabel", background=surface,
+                    foreground=ModernStyle.COLORS['text'], font=ModernStyle.FONTS['small'])
+    style.configure("Worker.Status.TLabel", background=surface,
+                    foreground=ModernStyle.COLORS['text_secondary'], font=('Arial', 8))
+    style.configure("Worker.Stats.TLabel", background=surface,
+                    foreground=ModernStyle.COLORS['text_muted'], font=('Arial', 7))
+    _STYLE_READY = True
+
+
+# Спільні обробники наведення: кольори беруться з атрибутів кнопки, замикання не потрібні
+def _button_enter(event):
+    event.widget.configure(bg=event.widget.hover_bg)
+
+
+def _button_leave(event):
+    event.widget.configure(bg=event.widget.default_bg)
+
+
+def _evenly(frame, n):
+    """Рівні колонки сітки одним викликом Tcl; uniform дає однакову ширину без перерахунку"""
+    frame.grid_columnconfigure(tuple(range(n)), weight=1, uniform='even')
+
+
+# Сталі дані сторінок: будуються один раз на процес
+NAV_ITEMS = (
+    ("🏠", "Головна", "main"),
+    ("👥", "Акаунти", "accounts"),
+    ("🎯", "Цілі", "targets"),
+    ("🔗", "Ланцюжок", "chain"),
+    ("📝", "Тексти", "texts"),
+    ("🌐", "Браузер", "browser"),
+    ("▶️", "Запуск", "run")
+)
+
+CARDS_DATA = (
+    ("👥", "Акаунтів", "0", "accounts_count"),
+    ("🎯", "Цілей", "0", "targets_count"),
+    ("🔗", "Дій", "0", "chain_count"),
+    ("📝", "Текстів", "0", "texts_count")
+)
+
+SIDEBAR = ModernStyle.COLORS['sidebar']
+SIDEBAR_ACTIVE = ModernStyle.COLORS['sidebar_active']
+
+
+def _nav_enter(event):
+    event.widget.configure(bg=SIDEBAR_ACTIVE)
+
+
+def _nav_leave(event):
+    widget = event.widget
+    widget.configure(bg=SIDEBAR_ACTIVE if getattr(widget, 'active', False) else SIDEBAR)
 
 
 class AnimatedButton(tk.Button):
@@ -80,41 +368,23 @@ class AnimatedButton(tk.Button):
     
     def __init__(self, parent, **kwargs):
         self.default_bg = kwargs.get('bg', ModernStyle.COLORS['primary'])
-        self.hover_bg = kwargs.get('hover_bg', ModernStyle.COLORS['primary_dark'])
-        
-        if 'hover_bg' in kwargs:
-            del kwargs['hover_bg']
+        self.hover_bg = kwargs.pop('hover_bg', ModernStyle.COLORS['primary_dark'])
         
-        super().__init__(parent, **kwargs)
-        
-        self.configure(
-            relief='flat',
-            borderwidth=0,
-            font=ModernStyle.FONTS['button'],
-            fg='white',
-            bg=self.default_bg,
-            cursor='hand2',
-            padx=12,
-            pady=6
+        # Весь стиль передається одним викликом конструктора, без повторного configure
+        super().__init__(
+            parent,
+            **{**kwargs, **ANIMATED_BUTTON, 'bg': self.default_bg, 'activebackground': self.hover_bg}
         )
         
-        self.bind('<Enter>', lambda e: self.configure(bg=self.hover_bg))
-        self.bind('<Leave>', lambda e: self.configure(bg=self.default_bg))
+        self.bind('<Enter>', _button_enter)
+        self.bind('<Leave>', _button_leave)
 
 
 class GlassCard(tk.Frame):
     """Скляна картка з оптимізованими розмірами"""
     
     def __init__(self, parent, title="", **kwargs):
-        super().__init__(parent, **kwargs)
-        
-        self.configure(
-            bg=ModernStyle.COLORS['card'],
-            relief='flat',
-            bd=1,
-            highlightbackground=ModernStyle.COLORS['border'],
-            highlightthickness=1
-        )
+        super().__init__(parent, **{**kwargs, **CARD_FRAME})
         
         if title:
             title_frame = tk.Frame(self, bg=ModernStyle.COLORS['card'])
@@ -123,16 +393,127 @@ class GlassCard(tk.Frame):
             title_label = tk.Label(
                 title_frame,
                 text=title,
-                font=ModernStyle.FONTS['heading'],
-                bg=ModernStyle.COLORS['card'],
-                fg=ModernStyle.COLORS['text']
+                **HEADING_CARD
             )
             title_label.pack(anchor='w')
 
 
+# Експериментальний Canvas-список акаунтів замість Treeview (для дуже великих списків)
+USE_CANVAS_LIST = False
+
+
+class CanvasAccountList(tk.Frame):
+    """Віртуальний список на Canvas: рядки - пул текстових елементів, що переставляються при прокрутці"""
+    
+    ROW_HEIGHT = 24
+    
+    def __init__(self, parent, columns, column_width=120):
+        super().__init__(parent, bg=ModernStyle.COLORS['background'])
+        self.column_width = column_width
+        
+        header = tk.Frame(self, bg=ModernStyle.COLORS['card'])
+        header.pack(fill='x')
+        for col in columns:
+            tk.Label(header, text=col, width=column_width // 8, anchor='w', **SMALL_CARD).pack(side='left')
+        
+        self.canvas = tk.Canvas(self, bg=ModernStyle.COLORS['background'], highlightthickness=0)
+        self.canvas.pack(fill='both', expand=True)
+        
+        self._data = {}
+        self._row_func = None
+        self._pool = []  # (фон, [тексти колонок], показані значення)
+        self._row_iids = []
+        self._top = 0
+        self._selected = None
+        
+        self.canvas.bind('<Configure>', lambda e: self._render())
+        self.canvas.bind('<MouseWheel>', self._on_wheel)
+        self.canvas.bind('<Button-1>', self._on_click)
+    
+    def set_scrollbar(self, command):
+        self.canvas.configure(yscrollcommand=command)
+    
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+    
+    def show(self, data, row_func):
+        """Відображення словника iid -> запис; row_func повертає значення колонок"""
+        self._data = data
+        self._row_func = row_func
+        if self._selected not in data:
+            self._selected = None
+        self._render()
+    
+    def selection(self):
+        return (self._selected,) if self._selected is not None else ()
+    
+    def _on_wheel(self, event):
+        self.yview('scroll', int(-1*(event.delta/120)) or (-1 if event.delta > 0 else 1), 'units')
+    
+    def _on_click(self, event):
+        position = int(self.canvas.canvasy(event.y)) // self.ROW_HEIGHT - self._top
+        if 0 <= position < len(self._row_iids):
+            self._selected = self._row_iids[position]
+            self._render()
+    
+    def _row(self, position):
+        """Рядок з пулу; нові елементи Canvas створюються лише при зростанні вікна"""
+        while len(self._pool) <= position:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, width=0)
+            texts = [self.canvas.create_text(0, 0, anchor='w', fill=ModernStyle.COLORS['text'],
+                                             font=ModernStyle.FONTS['small']) for _ in range(3)]
+            self._pool.append([rect, texts, None])
+        return self._pool[position]
+    
+    def _render(self):
+        canvas, height = self.canvas, self.ROW_HEIGHT
+        total = len(self._data)
+        width = canvas.winfo_width()
+        canvas.configure(scrollregion=(0, 0, width, total * height))
+        
+        top = self._top = int(canvas.canvasy(0)) // height
+        bottom = min(total, int(canvas.canvasy(canvas.winfo_height())) // height + 1)
+        window = list(islice(self._data.items(), top, bottom))
+        self._row_iids = [iid for iid, _ in window]
+        
+        for position, (iid, record) in enumerate(window):
+            row = self._row(position)
+            rect, texts = row[0], row[1]
+            y = (top + position) * height
+            fill = ModernStyle.COLORS['primary'] if iid == self._selected else ''
+            canvas.coords(rect, 0, y, width, y + height)
+            canvas.itemconfigure(rect, fill=fill, state='normal')
+            
+            values = self._row_func(record)
+            for column, text_id in enumerate(texts):
+                canvas.coords(text_id, 4 + column * self.column_width, y + height // 2)
+                canvas.itemconfigure(text_id, state='normal')
+            if values != row[2]:
+                for text_id, value in zip(texts, values):
+                    canvas.itemconfigure(text_id, text=value)
+                row[2] = values
+        
+        for rect, texts, _ in self._pool[len(window):]:
+            for item in (rect, *texts):
+                canvas.itemconfigure(item, state='hidden')
+
+
 class ActionDialog(tk.Toplevel):
     """Покращений діалог налаштування дії"""
     
+    # Змінні Tk спільні для всіх відкриттів діалогу
+    _shared_vars = {}
+    
+    @classmethod
+    def _reuse_var(cls, name, value):
+        """Повторне використання змінної Tk замість створення нової на кожне відкриття"""
+        var = cls._shared_vars.get(name)
+        if var is None:
+            var = cls._shared_vars[name] = tk.IntVar()
+        var.set(value)
+        return var
+    
     def __init__(self, parent, title, action_type=""):
         super().__init__(parent)
         self.result = None
@@ -194,12 +575,10 @@ class ActionDialog(tk.Toplevel):
         tk.Label(
             parent,
             text=f"Кількість {title}:",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **LABEL_BG
         ).pack(anchor='w', pady=(0, 5))
         
-        self.count_var = tk.IntVar(value=2 if self.action_type == 'like_posts' else 3)
+        self.count_var = self._reuse_var('count', 2 if self.action_type == 'like_posts' else 3)
         count_frame = tk.Frame(parent, bg=ModernStyle.COLORS['background'])
         count_frame.pack(fill='x', pady=5)
         
@@ -209,18 +588,14 @@ class ActionDialog(tk.Toplevel):
             to=max_count,
             width=10,
             textvariable=self.count_var,
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            **SPINBOX_SURFACE
         )
         count_spin.pack(side='left')
         
         tk.Label(
             count_frame,
             text=f"(макс. {max_count})",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text_secondary']
+            **HINT_BG
         ).pack(side='left', padx=(10, 0))
     
     def create_like_stories_settings(self, parent):
@@ -228,12 +603,10 @@ class ActionDialog(tk.Toplevel):
         tk.Label(
             parent,
             text="Кількість лайків сторіс:",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **LABEL_BG
         ).pack(anchor='w', pady=(0, 5))
         
-        self.count_var = tk.IntVar(value=2)
+        self.count_var = self._reuse_var('count', 2)
         count_frame = tk.Frame(parent, bg=ModernStyle.COLORS['background'])
         count_frame.pack(fill='x', pady=5)
         
@@ -243,18 +616,14 @@ class ActionDialog(tk.Toplevel):
             to=5,
             width=10,
             textvariable=self.count_var,
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            **SPINBOX_SURFACE
         )
         count_spin.pack(side='left')
         
         tk.Label(
             count_frame,
             text="(макс. 5)",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text_secondary']
+            **HINT_BG
         ).pack(side='left', padx=(10, 0))
         
         # Попередження
@@ -275,12 +644,10 @@ class ActionDialog(tk.Toplevel):
         tk.Label(
             parent,
             text="Затримка (секунди):",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **LABEL_BG
         ).pack(anchor='w', pady=(0, 5))
         
-        self.delay_var = tk.IntVar(value=30)
+        self.delay_var = self._reuse_var('delay', 30)
         delay_frame = tk.Frame(parent, bg=ModernStyle.COLORS['background'])
         delay_frame.pack(fill='x', pady=5)
         
@@ -290,18 +657,14 @@ class ActionDialog(tk.Toplevel):
             to=300,
             width=10,
             textvariable=self.delay_var,
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            **SPINBOX_SURFACE
         )
         delay_spin.pack(side='left')
         
         tk.Label(
             delay_frame,
             text="(5-300 сек)",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text_secondary']
+            **HINT_BG
         ).pack(side='left', padx=(10, 0))
     
     def create_general_settings(self, parent):
@@ -309,9 +672,7 @@ class ActionDialog(tk.Toplevel):
         tk.Label(
             parent,
             text="Дія буде додана з стандартними\nналаштуваннями",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text'],
+            **LABEL_BG,
             justify='center'
         ).pack(expand=True)
     
@@ -336,19 +697,62 @@ class ActionDialog(tk.Toplevel):
         self.destroy()
 
 
+@dataclass
+class ActionSpec:
+    """Дія ланцюжка (атрибути замість пошуку ключів у словнику)"""
+    
+    type: str
+    name: str
+    icon: str = ''
+    enabled: bool = True
+    settings: Optional[Dict[str, Any]] = None
+    extra: Optional[Dict[str, Any]] = None  # Інші ключі збереженого словника, повертаються в to_dict
+    
+    _KNOWN_KEYS = frozenset(('type', 'name', 'icon', 'enabled', 'settings'))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ActionSpec':
+        """Створення дії зі збереженого словника"""
+        extra = {key: value for key, value in data.items() if key not in cls._KNOWN_KEYS}
+        return cls(
+            type=data.get('type', ''),
+            name=data.get('name', data.get('type', '')),
+            icon=data.get('icon', ''),
+            enabled=data.get('enabled', True),
+            settings=data.get('settings'),
+            extra=extra or None
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Словник у форматі action_chain.json та automation_engine"""
+        data = dict(self.extra) if self.extra else {}
+        data.update(type=self.type, name=self.name)
+        if self.icon:
+            data['icon'] = self.icon
+        data['enabled'] = self.enabled
+        if self.settings is not None:
+            data['settings'] = self.settings
+        return data
+
+
 class ChainBuilderWidget(tk.Frame):
     """Оптимізований віджет для створення ланцюжка дій"""
     
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, on_change=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.configure(bg=ModernStyle.COLORS['surface'])
         
+        self.on_change = on_change  # Виклик після будь-якої зміни складу чи стану ланцюжка
         self.chain = []
+        self._mask = []  # Паралельна маска увімкнених дій для get_chain
         self.action_widgets = []
+        self._enabled_vars = []  # Пул змінних перемикачів, спільний для всіх перебудов
+        self._syncing_vars = False
+        self._sr_pending = False
         
         # Спроба автозавантаження
         if not self.load_chain_from_data():
-            print("Створено новий порожній ланцюжок")
+            logger.debug("Створено новий порожній ланцюжок")
         
         self.create_widgets()
     
@@ -358,9 +762,7 @@ class ChainBuilderWidget(tk.Frame):
         header = tk.Label(
             self,
             text="🔗 Конструктор ланцюжка дій",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_SURFACE
         )
         header.pack(pady=(10, 5))
         
@@ -371,9 +773,7 @@ class ChainBuilderWidget(tk.Frame):
         tk.Label(
             actions_frame,
             text="Доступні дії:",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            **SMALL_SURFACE
         ).pack(anchor='w')
         
         buttons_frame = tk.Frame(actions_frame, bg=ModernStyle.COLORS['surface'])
@@ -390,18 +790,22 @@ class ChainBuilderWidget(tk.Frame):
             ("🔄 Затримка", "delay", self.add_delay_action)
         ]
         
+        # По 4 кнопки в рядку; кожен рядок - окремий pack-контейнер
+        rows = [
+            tk.Frame(buttons_frame, bg=ModernStyle.COLORS['surface'])
+            for _ in range((len(action_buttons) + 3) // 4)
+        ]
+        
         for i, (text, action_type, command) in enumerate(action_buttons):
-            btn = AnimatedButton(
-                buttons_frame,
+            AnimatedButton(
+                rows[i // 4],
                 text=text,
                 command=command,
                 bg=ModernStyle.COLORS['primary']
-            )
-            btn.grid(row=i//4, column=i%4, padx=3, pady=2, sticky='ew')
+            ).pack(side='left', expand=True, fill='x', padx=3, pady=2)
         
-        # Налаштування сітки
-        for i in range(4):
-            buttons_frame.grid_columnconfigure(i, weight=1)
+        for row in rows:
+            row.pack(fill='x')
         
         # Поточний ланцюжок з оптимізованим розміром
         chain_card = GlassCard(self, title="Поточний ланцюжок")
@@ -420,10 +824,7 @@ class ChainBuilderWidget(tk.Frame):
         scrollbar = ttk.Scrollbar(chain_container, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = tk.Frame(self.canvas, bg=ModernStyle.COLORS['background'])
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar.set)
@@ -456,14 +857,21 @@ class ChainBuilderWidget(tk.Frame):
             bg=ModernStyle.COLORS['error']
         ).pack(side='right')
     
+    def _on_frame_configure(self, event=None):
+        """Відкладене оновлення області прокрутки (один перерахунок на пакет змін)"""
+        if self._sr_pending:
+            return
+        self._sr_pending = True
+        self.after_idle(self._apply_scrollregion)
+    
+    def _apply_scrollregion(self):
+        """Перерахунок області прокрутки"""
+        self._sr_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
     def add_follow_action(self):
         """Додавання дії підписки"""
-        self.add_action({
-            'type': 'follow',
-            'name': 'Підписка на користувача',
-            'icon': '👤',
-            'enabled': True
-        })
+        self.add_action(ActionSpec('follow', 'Підписка на користувача', '👤'))
     
     def add_like_posts_action(self):
         """Додавання дії лайку постів"""
@@ -472,13 +880,7 @@ class ChainBuilderWidget(tk.Frame):
         
         if dialog.result:
             count = dialog.result.get('count', 2)
-            self.add_action({
-                'type': 'like_posts',
-                'name': f'Лайк {count} постів',
-                'icon': '❤️',
-                'settings': {'count': count},
-                'enabled': True
-            })
+            self.add_action(ActionSpec('like_posts', f'Лайк {count} постів', '❤️', settings={'count': count}))
     
     def add_view_stories_action(self):
         """Додавання дії перегляду сторіс"""
@@ -487,21 +889,15 @@ class ChainBuilderWidget(tk.Frame):
         
         if dialog.result:
             count = dialog.result.get('count', 3)
-            self.add_action({
-                'type': 'view_stories',
-                'name': f'Перегляд {count} сторіс',
-                'icon': '📖',
-                'settings': {'count': count},
-                'enabled': True
-            })
+            self.add_action(ActionSpec('view_stories', f'Перегляд {count} сторіс', '📖', settings={'count': count}))
     
     def add_like_stories_action(self):
         """Додавання дії лайку сторіс з перевіркою"""
         # Перевірка кількості переглядів сторіс в ланцюжку
         view_stories_count = 0
         for action in self.chain:
-            if action.get('type') == 'view_stories' and action.get('enabled', True):
-                view_stories_count = max(view_stories_count, action.get('settings', {}).get('count', 0))
+            if action.type == 'view_stories' and action.enabled:
+                view_stories_count = max(view_stories_count, (action.settings or {}).get('count', 0))
         
         if view_stories_count == 0:
             messagebox.showwarning(
@@ -524,31 +920,15 @@ class ChainBuilderWidget(tk.Frame):
                 )
                 return
             
-            self.add_action({
-                'type': 'like_stories',
-                'name': f'Лайк {count} сторіс',
-                'icon': '💖',
-                'settings': {'count': count},
-                'enabled': True
-            })
+            self.add_action(ActionSpec('like_stories', f'Лайк {count} сторіс', '💖', settings={'count': count}))
     
     def add_reply_stories_action(self):
         """Додавання дії відповіді на сторіс"""
-        self.add_action({
-            'type': 'reply_stories',
-            'name': 'Відповідь на сторіс',
-            'icon': '💬',
-            'enabled': True
-        })
+        self.add_action(ActionSpec('reply_stories', 'Відповідь на сторіс', '💬'))
     
     def add_send_dm_action(self):
         """Додавання дії відправки DM"""
-        self.add_action({
-            'type': 'send_dm',
-            'name': 'Приватне повідомлення',
-            'icon': '📩',
-            'enabled': True
-        })
+        self.add_action(ActionSpec('send_dm', 'Приватне повідомлення', '📩'))
     
     def add_delay_action(self):
         """Додавання затримки"""
@@ -557,19 +937,13 @@ class ChainBuilderWidget(tk.Frame):
         
         if dialog.result:
             delay = dialog.result.get('delay', 30)
-            self.add_action({
-                'type': 'delay',
-                'name': f'Затримка {delay} сек',
-                'icon': '🔄',
-                'settings': {'delay': delay},
-                'enabled': True
-            })
+            self.add_action(ActionSpec('delay', f'Затримка {delay} сек', '🔄', settings={'delay': delay}))
     
     def add_action(self, action):
         """Додавання дії до ланцюжка"""
         self.chain.append(action)
-        print(f"Додано дію: {action.get('name', action.get('type'))}")
-        print(f"Загальна кількість дій в ланцюжку: {len(self.chain)}")
+        self._mask.append(action.enabled)
+        logger.debug("Додано дію: %s (усього дій: %d)", action.name, len(self.chain))
         self.update_chain_display()
         
         # Автоматичне збереження
@@ -585,6 +959,9 @@ class ChainBuilderWidget(tk.Frame):
         # Створення компактних віджетів для кожної дії
         for i, action in enumerate(self.chain):
             self.create_compact_action_widget(i, action)
+        
+        if self.on_change:
+            self.on_change()
     
     def create_compact_action_widget(self, index, action):
         """Створення компактного віджета дії"""
@@ -600,9 +977,7 @@ class ChainBuilderWidget(tk.Frame):
         step_label = tk.Label(
             main_container,
             text=f"{index + 1}.",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text_secondary'],
+            **SMALL_CARD_MUTED,
             width=3
         )
         step_label.pack(side='left')
@@ -613,10 +988,8 @@ class ChainBuilderWidget(tk.Frame):
         
         tk.Label(
             info_frame,
-            text=f"{action['icon']} {action['name']}",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text']
+            text=f"{action.icon} {action.name}",
+            **SMALL_CARD
         ).pack(anchor='w')
         
         # Кнопки управління
@@ -624,14 +997,12 @@ class ChainBuilderWidget(tk.Frame):
         btn_frame.pack(side='right')
         
         # Перемикач увімкнення
-        enabled_var = tk.BooleanVar(value=action.get('enabled', True))
         enabled_check = tk.Checkbutton(
             btn_frame,
-            variable=enabled_var,
+            variable=self._enabled_var(index, action.enabled),
             bg=ModernStyle.COLORS['card'],
             fg=ModernStyle.COLORS['text'],
-            selectcolor=ModernStyle.COLORS['surface'],
-            command=lambda idx=index, var=enabled_var: self.toggle_action(idx, var.get())
+            selectcolor=ModernStyle.COLORS['surface']
         )
         enabled_check.pack(side='right', padx=2)
         
@@ -678,20 +1049,42 @@ class ChainBuilderWidget(tk.Frame):
             )
             down_btn.pack(side='right', padx=1)
     
+    def _enabled_var(self, index, enabled):
+        """Змінна перемикача з пулу; trace реєструється лише при створенні"""
+        while len(self._enabled_vars) <= index:
+            var = tk.BooleanVar()
+            var.trace_add('write', lambda *args, i=len(self._enabled_vars), v=var: self._on_enabled_write(i, v))
+            self._enabled_vars.append(var)
+        
+        var = self._enabled_vars[index]
+        self._syncing_vars = True
+        try:
+            var.set(enabled)
+        finally:
+            self._syncing_vars = False
+        return var
+    
+    def _on_enabled_write(self, index, var):
+        """Зміна перемикача користувачем"""
+        if not self._syncing_vars:
+            self.toggle_action(index, var.get())
+    
     def toggle_action(self, index, enabled):
         """Перемикання стану дії"""
         if 0 <= index < len(self.chain):
-            self.chain[index]['enabled'] = enabled
-            action_name = self.chain[index].get('name', self.chain[index].get('type'))
-            status = "увімкнено" if enabled else "вимкнено"
-            print(f"Дію '{action_name}' {status}")
+            self.chain[index].enabled = enabled
+            self._mask[index] = enabled
+            logger.debug("Дію '%s' %s", self.chain[index].name, "увімкнено" if enabled else "вимкнено")
             self.save_chain_to_data()
+            if self.on_change:
+                self.on_change()
     
     def remove_action(self, index):
         """Видалення дії"""
         if 0 <= index < len(self.chain):
             removed = self.chain.pop(index)
-            print(f"Видалено дію: {removed.get('name', removed.get('type'))}")
+            self._mask.pop(index)
+            logger.debug("Видалено дію: %s", removed.name)
             self.update_chain_display()
             self.save_chain_to_data()
     
@@ -700,38 +1093,47 @@ class ChainBuilderWidget(tk.Frame):
         new_index = index + direction
         if 0 <= new_index < len(self.chain):
             self.chain[index], self.chain[new_index] = self.chain[new_index], self.chain[index]
+            self._mask[index], self._mask[new_index] = self._mask[new_index], self._mask[index]
             self.update_chain_display()
     
     def save_chain_to_data(self):
         """Автоматичне збереження ланцюжка в data/action_chain.json"""
+        def _report(future):
+            if future.exception():
+                logger.error("Помилка автозбереження ланцюжка: %s", future.exception())
+        
         try:
             os.makedirs('data', exist_ok=True)
-            with open('data/action_chain.json', 'w', encoding='utf-8') as f:
-                json.dump(self.chain, f, indent=2, ensure_ascii=False)
-            print(f"Автоматично збережено ланцюжок з {len(self.chain)} дій")
-        except Exception as e:
-            print(f"Помилка автозбереження ланцюжка: {e}")
+            # Запис з fsync - у потоці записів, не в головному
+            future = _submit_write('data/action_chain.json', self.chain_as_dicts())
+            if future is not None:
+                _when_done(self, future, _report)
+            logger.debug("Автоматично збережено ланцюжок з %d дій", len(self.chain))
+        except Exception:
+            logger.exception("Помилка автозбереження ланцюжка")
     
     def load_chain_from_data(self):
         """Автоматичне завантаження ланцюжка з data/action_chain.json"""
         try:
             if os.path.exists('data/action_chain.json'):
-                with open('data/action_chain.json', 'r', encoding='utf-8') as f:
-                    self.chain = json.load(f)
-                print(f"Автоматично завантажено ланцюжок з {len(self.chain)} дій")
+                with open('data/action_chain.json', 'rb') as f:
+                    self.chain = [ActionSpec.from_dict(action) for action in _loads(f.read())]
+                self._mask = [action.enabled for action in self.chain]
+                logger.debug("Автоматично завантажено ланцюжок з %d дій", len(self.chain))
                 self.update_chain_display()
                 return True
-        except Exception as e:
-            print(f"Помилка автозавантаження ланцюжка: {e}")
+        except Exception:
+            logger.exception("Помилка автозавантаження ланцюжка")
         return False
     
     def clear_chain(self):
         """Очищення ланцюжка"""
         if messagebox.askyesno("Підтвердження", "Очистити весь ланцюжок?"):
             self.chain.clear()
+            self._mask.clear()
             self.update_chain_display()
             self.save_chain_to_data()
-            print("Ланцюжок очищено")
+            logger.debug("Ланцюжок очищено")
     
     def save_chain(self):
         """Збереження ланцюжка"""
@@ -746,12 +1148,13 @@ class ChainBuilderWidget(tk.Frame):
         )
         
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.chain, f, indent=2, ensure_ascii=False)
-                messagebox.showinfo("Успіх", f"Ланцюжок збережено: {filename}")
-            except Exception as e:
-                messagebox.showerror("Помилка", f"Не вдалося зберегти: {e}")
+            def _report(future):
+                if future.exception():
+                    messagebox.showerror("Помилка", f"Не вдалося зберегти: {future.exception()}")
+                else:
+                    messagebox.showinfo("Успіх", f"Ланцюжок збережено: {filename}")
+            
+            _when_done(self, _WRITE_POOL.submit(_write_atomic, filename, _dumps(self.chain_as_dicts())), _report)
     
     def load_chain(self):
         """Завантаження ланцюжка"""
@@ -761,22 +1164,31 @@ class ChainBuilderWidget(tk.Frame):
         )
         
         if filename:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.chain = json.load(f)
-                self.update_chain_display()
-                messagebox.showinfo("Успіх", f"Ланцюжок завантажено: {filename}")
-            except Exception as e:
-                messagebox.showerror("Помилка", f"Не вдалося завантажити: {e}")
+            _when_done(self, _IO_EXECUTOR.submit(_read_json, filename),
+                       lambda future: self._apply_loaded_chain(future, filename))
+    
+    def _apply_loaded_chain(self, future, filename):
+        """Застосування ланцюжка, розібраного у фоновому потоці"""
+        try:
+            self.chain = [ActionSpec.from_dict(action) for action in future.result()]
+            self._mask = [action.enabled for action in self.chain]
+            self.update_chain_display()
+            messagebox.showinfo("Успіх", f"Ланцюжок завантажено: {filename}")
+        except Exception as e:
+            messagebox.showerror("Помилка", f"Не вдалося завантажити: {e}")
+    
+    def chain_as_dicts(self):
+        """Весь ланцюжок у вигляді словників для збереження"""
+        return [action.to_dict() for action in self.chain]
     
     def get_chain(self):
         """Отримання поточного ланцюжка - тільки увімкнені дії"""
-        enabled_actions = [action for action in self.chain if action.get('enabled', True)]
-        print(f"ChainBuilder: повертаю {len(enabled_actions)} увімкнених дій з {len(self.chain)} загальних")
+        enabled_actions = [action.to_dict() for action in compress(self.chain, self._mask)]
+        logger.debug("ChainBuilder: повертаю %d увімкнених дій з %d загальних", len(enabled_actions), len(self.chain))
         
-        if enabled_actions:
+        if logger.isEnabledFor(logging.DEBUG):
             for i, action in enumerate(enabled_actions):
-                print(f"  Увімкнена дія {i+1}: {action.get('name', action.get('type'))}")
+                logger.debug("  Увімкнена дія %d: %s", i + 1, action.get('name', action.get('type')))
         
         return enabled_actions
 
@@ -801,8 +1213,10 @@ class WorkerConfigWidget(tk.Frame):
     
     def create_widgets(self):
         """Створення віджетів конфігурації воркера"""
+        C, F = ModernStyle.C, ModernStyle.F
+        
         # Заголовок воркера
-        header_frame = tk.Frame(self, bg=ModernStyle.COLORS['card'])
+        header_frame = tk.Frame(self, bg=C.card)
         header_frame.pack(fill='x', padx=10, pady=(8, 5))
         
         # Перемикач увімкнення воркера
@@ -810,9 +1224,9 @@ class WorkerConfigWidget(tk.Frame):
         enabled_check = tk.Checkbutton(
             header_frame,
             variable=self.enabled_var,
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text'],
-            selectcolor=ModernStyle.COLORS['surface'],
+            bg=C.card,
+            fg=C.text,
+            selectcolor=C.surface,
             command=self.on_enabled_change
         )
         enabled_check.pack(side='left')
@@ -820,32 +1234,32 @@ class WorkerConfigWidget(tk.Frame):
         tk.Label(
             header_frame,
             text=f"Воркер #{self.worker_id + 1}",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text']
+            font=F.body,
+            bg=C.card,
+            fg=C.text
         ).pack(side='left', padx=(5, 0))
         
         # Статус
         self.status_label = tk.Label(
             header_frame,
             text="Налаштування",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text_secondary']
+            font=F.small,
+            bg=C.card,
+            fg=C.text_secondary
         )
         self.status_label.pack(side='right')
         
         # Контейнер налаштувань
-        self.config_frame = tk.Frame(self, bg=ModernStyle.COLORS['card'])
+        self.config_frame = tk.Frame(self, bg=C.card)
         self.config_frame.pack(fill='x', padx=10, pady=(0, 8))
         
         # Вибір акаунту
         tk.Label(
             self.config_frame,
             text="Акаунт:",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text']
+            font=F.small,
+            bg=C.card,
+            fg=C.text
         ).grid(row=0, column=0, sticky='w', pady=2)
         
         self.account_var = tk.StringVar()
@@ -868,9 +1282,9 @@ class WorkerConfigWidget(tk.Frame):
         tk.Label(
             self.config_frame,
             text="Цілі (макс):",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text']
+            font=F.small,
+            bg=C.card,
+            fg=C.text
         ).grid(row=1, column=0, sticky='w', pady=2)
         
         self.targets_count_var = tk.IntVar(value=min(10, len(self.targets)))
@@ -880,9 +1294,9 @@ class WorkerConfigWidget(tk.Frame):
             to=len(self.targets) if self.targets else 1,
             width=8,
             textvariable=self.targets_count_var,
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            font=F.small,
+            bg=C.surface,
+            fg=C.text
         )
         targets_spin.grid(row=1, column=1, sticky='w', padx=(5, 0), pady=2)
         
@@ -928,6 +1342,43 @@ class WorkerConfigWidget(tk.Frame):
         }
 
 
+STATUS_COLORS = {
+    'idle': ModernStyle.COLORS['text_secondary'],
+    'working': ModernStyle.COLORS['success'],
+    'error': ModernStyle.COLORS['error'],
+    'paused': ModernStyle.COLORS['warning'],
+    'disabled': ModernStyle.COLORS['text_muted']
+}
+
+# Тексти статусів, що не залежать від поточної цілі ('working' формується окремо)
+STATUS_TEXTS_STATIC = {
+    'idle': 'Очікування',
+    'error': 'Помилка',
+    'paused': 'Пауза',
+    'disabled': 'Вимкнено'
+}
+
+
+def _status_view(status, current_target):
+    """Текст статусу і колір індикатора воркера"""
+    if status == 'working':
+        text = f'{current_target}' if current_target else 'Активний'
+    else:
+        text = STATUS_TEXTS_STATIC.get(status, 'Невідомо')
+    return text, STATUS_COLORS.get(status, STATUS_COLORS['idle'])
+
+
+# Шаблон рядка статистики; форматується лише коли змінився ключ _stats_key
+_STATS_FMT = "Цілі: {} | Дії: {} | Успішно: {}".format
+
+
+def _stats_key(stats):
+    """Значення, з яких складається рядок статистики воркера"""
+    return (stats.get('processed_targets', 0),
+            stats.get('total_actions', 0),
+            stats.get('successful_actions', 0))
+
+
 class CompactWorkerStatusWidget(tk.Frame):
     """Компактний віджет статусу воркера"""
     
@@ -937,94 +1388,199 @@ class CompactWorkerStatusWidget(tk.Frame):
         
         self.worker_id = worker_id
         self.status = 'idle'
-        
+        self._shown_status = None  # (status, current_target), що зараз на екрані
+        self._shown_stats = (0, 0, 0)  # Ключ статистики, що зараз на екрані
+        self._shown_text = None
+        self._shown_color = None
+        # Оновлення накопичуються і застосовуються одним проходом у after_idle
+        self._pending_status = None
+        self._pending_stats = None
+        self._flush_scheduled = False
+        
+        _ensure_styles()
         self.create_widgets()
     
     def create_widgets(self):
         """Створення компактних віджетів"""
-        # Основний контейнер
-        main_frame = tk.Frame(self, bg=ModernStyle.COLORS['surface'])
+        # Оформлення задане іменованими ttk-стилями, тож віджети створюються без опцій кольору
+        # і шрифту; один контейнер із сіткою замість вкладених фреймів
+        main_frame = ttk.Frame(self, style='Worker.TFrame')
         main_frame.pack(fill='x', padx=8, pady=4)
+        main_frame.grid_columnconfigure(2, weight=1)
         
-        # Ліва частина: статус
-        left_frame = tk.Frame(main_frame, bg=ModernStyle.COLORS['surface'])
-        left_frame.pack(side='left', fill='x', expand=True)
-        
-        # Статус індикатор та назва
-        status_frame = tk.Frame(left_frame, bg=ModernStyle.COLORS['surface'])
-        status_frame.pack(fill='x')
+        self.status_dot = ttk.Label(main_frame, text="●", style='Worker.Dot.TLabel')
+        self.status_dot.grid(row=0, column=0)
         
-        self.status_dot = tk.Label(
-            status_frame,
-            text="●",
-            font=('Arial', 10),
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text_secondary']
-        )
-        self.status_dot.pack(side='left')
+        ttk.Label(main_frame, text=f"Воркер #{self.worker_id + 1}",
+                  style='Worker.Name.TLabel').grid(row=0, column=1, padx=(5, 0))
         
-        tk.Label(
-            status_frame,
-            text=f"Воркер #{self.worker_id + 1}",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
-        ).pack(side='left', padx=(5, 0))
-        
-        self.status_label = tk.Label(
-            status_frame,
-            text="Очікування",
-            font=('Arial', 8),
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text_secondary']
-        )
-        self.status_label.pack(side='right')
-        
-        # Права частина: компактна статистика
-        right_frame = tk.Frame(main_frame, bg=ModernStyle.COLORS['surface'])
-        right_frame.pack(side='right')
+        self.status_label = ttk.Label(main_frame, text="Очікування", style='Worker.Status.TLabel')
+        self.status_label.grid(row=0, column=2, sticky='e')
         
         # Статистика в одному рядку
-        self.stats_label = tk.Label(
-            right_frame,
-            text="Цілі: 0 | Дії: 0 | Успішно: 0",
-            font=('Arial', 7),
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text_muted']
-        )
-        self.stats_label.pack()
+        self.stats_label = ttk.Label(main_frame, text=_STATS_FMT(*self._shown_stats),
+                                     style='Worker.Stats.TLabel')
+        self.stats_label.grid(row=0, column=3, padx=(8, 0))
     
     def update_status(self, status, current_target=None, account=None):
-        """Оновлення статусу воркера"""
+        """Оновлення статусу воркера (застосовується при найближчому простої)"""
         self.status = status
-        
-        status_colors = {
-            'idle': ModernStyle.COLORS['text_secondary'],
-            'working': ModernStyle.COLORS['success'],
-            'error': ModernStyle.COLORS['error'],
-            'paused': ModernStyle.COLORS['warning'],
-            'disabled': ModernStyle.COLORS['text_muted']
-        }
-        
-        status_texts = {
-            'idle': 'Очікування',
-            'working': f'{current_target}' if current_target else 'Активний',
-            'error': 'Помилка',
-            'paused': 'Пауза',
-            'disabled': 'Вимкнено'
-        }
-        
-        self.status_dot.configure(fg=status_colors.get(status, status_colors['idle']))
-        self.status_label.configure(text=status_texts.get(status, 'Невідомо'))
+        if self._pending_status is None and (status, current_target) == self._shown_status:
+            return  # На екрані вже те саме - не плануємо прохід
+        self._pending_status = (status, current_target)
+        self._schedule_flush()
+    
+    def reset(self):
+        """Повернення до початкового стану при повторному використанні з пулу"""
+        self._pending_stats = None
+        self.update_status('idle')
+        self.update_stats({})
     
     def update_stats(self, stats):
-        """Оновлення статистики воркера"""
-        targets = stats.get('processed_targets', 0)
-        total = stats.get('total_actions', 0) 
-        successful = stats.get('successful_actions', 0)
-        
-        stats_text = f"Цілі: {targets} | Дії: {total} | Успішно: {successful}"
-        self.stats_label.configure(text=stats_text)
+        """Оновлення статистики воркера (проміжні значення відкидаються)"""
+        if self._pending_stats is None:
+            self._pending_stats = dict(stats)
+        else:
+            self._pending_stats.update(stats)
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
+    
+    def _flush(self):
+        """Застосування накопичених статусу і статистики"""
+        self._flush_scheduled = False
+        if self._pending_status is not None:
+            self._apply_status(*self._pending_status)
+            self._pending_status = None
+        if self._pending_stats is not None:
+            self._apply_stats(self._pending_stats)
+            self._pending_stats = None
+    
+    def _apply_status(self, status, current_target):
+        if (status, current_target) == self._shown_status:
+            return
+        self._shown_status = (status, current_target)
+        
+        text, color = _status_view(status, current_target)
+        
+        # Зміна цілі в 'working' не змінює колір, а різні статуси можуть мати однаковий текст
+        if text != self._shown_text:
+            self.status_label.configure(text=text)
+            self._shown_text = text
+        if color != self._shown_color:
+            self.status_dot.configure(foreground=color)
+            self._shown_color = color
+    
+    def _apply_stats(self, stats):
+        key = _stats_key(stats)
+        if key != self._shown_stats:
+            self.stats_label.configure(text=_STATS_FMT(*key))
+            self._shown_stats = key
+
+
+USE_CANVAS_WORKERS = False
+
+# Скільки акаунтів (браузерів) run_chain_all обробляє одночасно
+MAX_PARALLEL_ACCOUNTS = 4
+
+
+class _WorkerCanvasRow:
+    """Рядок WorkersCanvasView з тим самим інтерфейсом, що й CompactWorkerStatusWidget"""
+    
+    __slots__ = ('view', 'worker_id', 'status')
+    
+    def __init__(self, view, worker_id):
+        self.view = view
+        self.worker_id = worker_id
+        self.status = 'idle'
+    
+    def update_status(self, status, current_target=None, account=None):
+        self.status = status
+        self.view.set_status(self.worker_id, status, current_target)
+    
+    def update_stats(self, stats):
+        self.view.set_stats(self.worker_id, stats)
+    
+    def reset(self):
+        self.update_status('idle')
+        self.update_stats({})
+
+
+class WorkersCanvasView(tk.Canvas):
+    """Статуси всіх воркерів на одному Canvas: рядок - кілька елементів, що змінюються через itemconfigure"""
+    
+    ROW_HEIGHT = 26
+    STATUS_OFFSET = 170  # Відступ правого краю тексту статусу від правого краю полотна
+    
+    def __init__(self, parent):
+        super().__init__(parent, bg=ModernStyle.COLORS['card'], highlightthickness=0, height=0)
+        self._rows = []  # {id елементів, показані текст/колір/статистика}
+        self._handles = []
+        self._count = 0
+        self.bind('<Configure>', self._on_resize)
+    
+    def set_count(self, count):
+        """Кількість видимих рядків; зайві ховаються, а не видаляються. Повертає рядки воркерів"""
+        width = self.winfo_width()
+        while len(self._rows) < count:
+            self._create_row(len(self._rows), width)
+        for i, row in enumerate(self._rows):
+            if (i < count) != (i < self._count):
+                state = 'normal' if i < count else 'hidden'
+                for item in row['items']:
+                    self.itemconfigure(item, state=state)
+                if i < count:
+                    self._handles[i].reset()
+        self._count = count
+        self.configure(height=count * self.ROW_HEIGHT)
+        return self._handles[:count]
+    
+    def _create_row(self, i, width):
+        C = ModernStyle.C
+        top = i * self.ROW_HEIGHT
+        y = top + self.ROW_HEIGHT // 2
+        bg = self.create_rectangle(0, top + 1, width, top + self.ROW_HEIGHT - 1, fill=C.surface, width=0)
+        dot = self.create_oval(8, y - 4, 16, y + 4, fill=C.text_secondary, width=0)
+        name = self.create_text(22, y, anchor='w', text=f"Воркер #{i + 1}", fill=C.text,
+                                font=ModernStyle.FONTS['small'])
+        status = self.create_text(width - self.STATUS_OFFSET, y, anchor='e', text="Очікування",
+                                  fill=C.text_secondary, font=('Arial', 8))
+        stats = self.create_text(width - 8, y, anchor='e', text=_STATS_FMT(0, 0, 0),
+                                 fill=C.text_muted, font=('Arial', 7))
+        self._rows.append({'items': (bg, dot, name, status, stats), 'bg': bg, 'dot': dot,
+                           'status': status, 'stats': stats, 'text': "Очікування",
+                           'color': C.text_secondary, 'stats_key': (0, 0, 0)})
+        self._handles.append(_WorkerCanvasRow(self, i))
+    
+    def _on_resize(self, event):
+        """Праві колонки прив'язані до ширини: при її зміні переставляються лише координати"""
+        width = event.width
+        for i, row in enumerate(self._rows):
+            top = i * self.ROW_HEIGHT
+            y = top + self.ROW_HEIGHT // 2
+            self.coords(row['bg'], 0, top + 1, width, top + self.ROW_HEIGHT - 1)
+            self.coords(row['status'], width - self.STATUS_OFFSET, y)
+            self.coords(row['stats'], width - 8, y)
+    
+    def set_status(self, worker_id, status, current_target=None):
+        row = self._rows[worker_id]
+        text, color = _status_view(status, current_target)
+        if text != row['text']:
+            self.itemconfigure(row['status'], text=text)
+            row['text'] = text
+        if color != row['color']:
+            self.itemconfigure(row['dot'], fill=color)
+            row['color'] = color
+    
+    def set_stats(self, worker_id, stats):
+        row = self._rows[worker_id]
+        key = _stats_key(stats)
+        if key != row['stats_key']:
+            self.itemconfigure(row['stats'], text=_STATS_FMT(*key))
+            row['stats_key'] = key
 
 
 class InstagramBotGUI:
@@ -1041,12 +1597,52 @@ class InstagramBotGUI:
             print("⚠️ DataManager недоступний - використовується fallback")
         
         self.automation_manager = None
+        self._fan_out_active = False  # Чи виконується run_chain_all
+        self._fan_out_stop = threading.Event()
+        self._fan_out_lock = threading.Lock()
+        self._fan_out_automations = []  # InstagramAutomation запущених run_chain_all браузерів
         self.worker_widgets = []
+        self._widget_pool = []  # Приховані статусні віджети для повторного використання
         self.worker_configs = []
+        self._pending_saves = {}  # вид даних -> id відкладеного збереження
+        # Оновлення воркерів приходять з потоку автоматизації в обмежену чергу;
+        # головний потік розбирає її кожні 50 мс, зливаючи події по worker_id
+        self._event_q = queue.Queue(maxsize=1024)
+        os.makedirs('data', exist_ok=True)  # Один раз: усі збереження пишуть у data/
+        
+        # Дані живуть незалежно від сторінок: сторінки будуються при першому показі
+        self.accounts = {}  # username -> акаунт, у порядку додавання
+        self._account_display = {}  # username -> (проксі, статус, готовий рядок таблиці); не потрапляє в JSON
+        self.targets = []
+        self._targets_set = set()
+        self.texts = {'story_replies': [], 'direct_messages': []}
+        self._texts_count = 0  # Сума довжин усіх списків texts, ведеться при змінах
+        self.browser_settings = {}
+        # Лічильники головної сторінки перераховуються лише для змінених видів даних
+        self._stat_cache = {}  # вид даних -> текст, що зараз на екрані
+        self._stat_dirty = {'accounts', 'targets', 'chain', 'texts'}
+        self._settings_path = 'data/browser_settings.json'
+        self._last_browser_blob = None  # Вміст browser_settings.json на диску
+        
+        self.browser_var = tk.StringVar(value='chrome')
+        self.headless_var = tk.BooleanVar()
+        self.stealth_var = tk.BooleanVar(value=True)
+        self.proxy_enabled_var = tk.BooleanVar(value=True)
+        # Зміна значення (з будь-якого джерела) планує відкладене автозбереження;
+        # незмінений вміст відсіюється в save_browser_settings
+        self._browser_fields = (
+            ('browser_type', self.browser_var),
+            ('headless', self.headless_var),
+            ('stealth_mode', self.stealth_var),
+            ('proxy_enabled', self.proxy_enabled_var)
+        )
+        for _, var in self._browser_fields:
+            var.trace_add('write', self._browser_settings_changed)
         
         self.setup_window()
         self.create_widgets()
         self.load_all_data()
+        self.root.after(50, self._drain_events)
     
     def setup_window(self):
         """Налаштування головного вікна з оптимізованими розмірами"""
@@ -1065,72 +1661,58 @@ class InstagramBotGUI:
     
     def create_widgets(self):
         """Створення віджетів інтерфейсу"""
+        C, F = ModernStyle.C, ModernStyle.F
+        
         # Головний контейнер
-        main_container = tk.Frame(self.root, bg=ModernStyle.COLORS['background'])
+        main_container = tk.Frame(self.root, bg=C.background)
         main_container.pack(fill='both', expand=True)
         
         # Компактна бічна панель
-        sidebar = tk.Frame(main_container, bg=ModernStyle.COLORS['sidebar'], width=250)
+        sidebar = tk.Frame(main_container, bg=C.sidebar, width=250)
         sidebar.pack(side='left', fill='y')
         sidebar.pack_propagate(False)
         
         # Компактний логотип
-        logo_frame = tk.Frame(sidebar, bg=ModernStyle.COLORS['sidebar'])
+        logo_frame = tk.Frame(sidebar, bg=C.sidebar)
         logo_frame.pack(fill='x', pady=15)
         
         tk.Label(
             logo_frame,
             text="🤖 Instagram Bot Pro",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['sidebar'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_SIDEBAR
         ).pack()
         
         tk.Label(
             logo_frame,
             text="v3.0 Multi-Worker Edition",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['sidebar'],
-            fg=ModernStyle.COLORS['text_secondary']
+            **SMALL_SIDEBAR_MUTED
         ).pack()
         
         # Статус автоматизації
-        status_frame = tk.Frame(logo_frame, bg=ModernStyle.COLORS['sidebar'])
+        status_frame = tk.Frame(logo_frame, bg=C.sidebar)
         status_frame.pack(pady=(5, 0))
         
         tk.Label(
             status_frame,
             text="🤖 РЕАЛЬНА РОБОТА",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['success'],
+            font=F.small,
+            bg=C.success,
             fg='white',
             padx=8,
             pady=2
         ).pack()
         
         # Компактна навігація
-        nav_frame = tk.Frame(sidebar, bg=ModernStyle.COLORS['sidebar'])
+        nav_frame = tk.Frame(sidebar, bg=C.sidebar)
         nav_frame.pack(fill='x', padx=8, pady=15)
         
         self.nav_buttons = {}
-        nav_items = [
-            ("🏠", "Головна", "main"),
-            ("👥", "Акаунти", "accounts"),
-            ("🎯", "Цілі", "targets"),
-            ("🔗", "Ланцюжок", "chain"),
-            ("📝", "Тексти", "texts"),
-            ("🌐", "Браузер", "browser"),
-            ("▶️", "Запуск", "run")
-        ]
-        
-        for icon, text, page in nav_items:
+        for icon, text, page in NAV_ITEMS:
             btn = tk.Button(
                 nav_frame,
                 text=f"  {icon}  {text}",
                 command=lambda p=page: self.show_page(p),
-                font=ModernStyle.FONTS['small'],
-                bg=ModernStyle.COLORS['sidebar'],
-                fg=ModernStyle.COLORS['text'],
+                **SMALL_SIDEBAR,
                 relief='flat',
                 anchor='w',
                 padx=12,
@@ -1140,34 +1722,45 @@ class InstagramBotGUI:
             btn.pack(fill='x', pady=1)
             
             # Hover ефекти
-            btn.bind('<Enter>', lambda e, b=btn: b.configure(bg=ModernStyle.COLORS['sidebar_active']))
-            btn.bind('<Leave>', lambda e, b=btn: b.configure(bg=ModernStyle.COLORS['sidebar']) if not getattr(b, 'active', False) else None)
+            btn.bind('<Enter>', _nav_enter)
+            btn.bind('<Leave>', _nav_leave)
             
             self.nav_buttons[page] = btn
         
         # Компактний статус системи
-        status_frame = tk.Frame(sidebar, bg=ModernStyle.COLORS['sidebar'])
+        status_frame = tk.Frame(sidebar, bg=C.sidebar)
         status_frame.pack(side='bottom', fill='x', padx=15, pady=15)
         
         tk.Label(
             status_frame,
             text="Статус:",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['sidebar'],
-            fg=ModernStyle.COLORS['text_secondary']
+            **SMALL_SIDEBAR_MUTED
         ).pack(anchor='w')
         
         self.status_label = tk.Label(
             status_frame,
             text="● Готовий",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['sidebar'],
-            fg=ModernStyle.COLORS['success']
+            font=F.small,
+            bg=C.sidebar,
+            fg=C.success
         )
         self.status_label.pack(anchor='w', pady=2)
         
+        # Короткі повідомлення замість модальних вікон (див. _flash_status)
+        self.status_message = tk.Label(
+            status_frame,
+            text="",
+            font=F.small,
+            bg=C.sidebar,
+            fg=C.text_secondary,
+            wraplength=210,
+            justify='left'
+        )
+        self.status_message.pack(anchor='w')
+        self._flash_after = None
+        
         # Область контенту
-        self.content_area = tk.Frame(main_container, bg=ModernStyle.COLORS['background'])
+        self.content_area = tk.Frame(main_container, bg=C.background)
         self.content_area.pack(side='right', fill='both', expand=True)
         
         # Створення сторінок
@@ -1177,109 +1770,85 @@ class InstagramBotGUI:
         self.show_page("main")
     
     def create_pages(self):
-        """Створення всіх сторінок"""
+        """Реєстрація сторінок; кожна будується при першому показі (див. show_page)"""
         self.pages = {}
-        
-        # Головна сторінка
-        self.pages["main"] = self.create_main_page()
-        
-        # Сторінка акаунтів
-        self.pages["accounts"] = self.create_accounts_page()
-        
-        # Сторінка цілей
-        self.pages["targets"] = self.create_targets_page()
-        
-        # Сторінка ланцюжка дій
-        self.pages["chain"] = ChainBuilderWidget(self.content_area)
-        
-        # Сторінка текстів
-        self.pages["texts"] = self.create_texts_page()
-        
-        # Сторінка браузера
-        self.pages["browser"] = self.create_browser_page()
-        
-        # Сторінка запуску
-        self.pages["run"] = self.create_run_page()
+        self._page_factories = {
+            "main": self.create_main_page,
+            "accounts": self.create_accounts_page,
+            "targets": self.create_targets_page,
+            "chain": lambda: ChainBuilderWidget(self.content_area, on_change=lambda: self.invalidate('chain')),
+            "texts": self.create_texts_page,
+            "browser": self.create_browser_page,
+            "run": self.create_run_page
+        }
     
     def create_main_page(self):
         """Створення компактної головної сторінки"""
-        page = tk.Frame(self.content_area, bg=ModernStyle.COLORS['background'])
+        C = ModernStyle.C
+        
+        page = tk.Frame(self.content_area, bg=C.background)
         
         # Компактний заголовок
         header = tk.Label(
             page,
             text="🏠 Панель управління",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_BG
         )
         header.pack(pady=15)
         
         # Компактні статистичні картки
-        stats_frame = tk.Frame(page, bg=ModernStyle.COLORS['background'])
+        stats_frame = tk.Frame(page, bg=C.background)
         stats_frame.pack(fill='x', padx=15, pady=10)
         
         # Картки статистики в сітці 2x2
-        cards_data = [
-            ("👥", "Акаунтів", "0", "accounts_count"),
-            ("🎯", "Цілей", "0", "targets_count"),
-            ("🔗", "Дій", "0", "chain_count"),
-            ("📝", "Текстів", "0", "texts_count")
-        ]
-        
         self.stat_labels = {}
         
-        for i, (icon, title, value, key) in enumerate(cards_data):
+        for i, (icon, title, value, key) in enumerate(CARDS_DATA):
             row, col = i // 2, i % 2
             
             card = GlassCard(stats_frame)
             card.grid(row=row, column=col, padx=8, pady=5, sticky='ew')
             
-            content = tk.Frame(card, bg=ModernStyle.COLORS['card'])
+            content = tk.Frame(card, bg=C.card)
             content.pack(fill='both', expand=True, padx=15, pady=10)
             
             tk.Label(
                 content,
                 text=icon,
                 font=('Arial', 24),
-                bg=ModernStyle.COLORS['card'],
-                fg=ModernStyle.COLORS['primary']
+                bg=C.card,
+                fg=C.primary
             ).pack()
             
             value_label = tk.Label(
                 content,
                 text=value,
-                font=ModernStyle.FONTS['heading'],
-                bg=ModernStyle.COLORS['card'],
-                fg=ModernStyle.COLORS['text']
+                **HEADING_CARD
             )
             value_label.pack()
             
             tk.Label(
                 content,
                 text=title,
-                font=ModernStyle.FONTS['small'],
-                bg=ModernStyle.COLORS['card'],
-                fg=ModernStyle.COLORS['text_secondary']
+                **SMALL_CARD_MUTED
             ).pack()
             
             self.stat_labels[key] = value_label
         
-        stats_frame.grid_columnconfigure(0, weight=1)
-        stats_frame.grid_columnconfigure(1, weight=1)
+        _evenly(stats_frame, 2)
         
         # Компактні швидкі дії
         actions_frame = GlassCard(page, title="Швидкі дії")
         actions_frame.pack(fill='x', padx=15, pady=15)
         
-        actions_content = tk.Frame(actions_frame, bg=ModernStyle.COLORS['card'])
+        actions_content = tk.Frame(actions_frame, bg=C.card)
         actions_content.pack(fill='x', padx=15, pady=(0, 15))
         
         buttons = [
-            ("➕ Додати акаунт", lambda: self.show_page("accounts"), ModernStyle.COLORS['success']),
-            ("🎯 Додати ціль", lambda: self.show_page("targets"), ModernStyle.COLORS['primary']),
-            ("🔗 Налаштувати дії", lambda: self.show_page("chain"), ModernStyle.COLORS['warning']),
-            ("▶️ Запустити бота", lambda: self.show_page("run"), ModernStyle.COLORS['success'])
+            ("➕ Додати акаунт", lambda: self.show_page("accounts"), C.success),
+            ("🎯 Додати ціль", lambda: self.show_page("targets"), C.primary),
+            ("🔗 Налаштувати дії", lambda: self.show_page("chain"), C.warning),
+            ("▶️ Запустити бота", lambda: self.show_page("run"), C.success)
         ]
         
         for i, (text, command, color) in enumerate(buttons):
@@ -1291,8 +1860,7 @@ class InstagramBotGUI:
                 bg=color
             ).grid(row=row, column=col, padx=5, pady=3, sticky='ew')
         
-        actions_content.grid_columnconfigure(0, weight=1)
-        actions_content.grid_columnconfigure(1, weight=1)
+        _evenly(actions_content, 2)
         
         return page
     
@@ -1303,9 +1871,7 @@ class InstagramBotGUI:
         header = tk.Label(
             page,
             text="👥 Управління акаунтами",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_BG
         )
         header.pack(pady=10)
         
@@ -1332,8 +1898,7 @@ class InstagramBotGUI:
         self.proxy_var = tk.StringVar()
         tk.Entry(fields_frame, textvariable=self.proxy_var, **self.entry_style()).grid(row=1, column=1, columnspan=3, sticky='ew', padx=5, pady=5)
         
-        fields_frame.grid_columnconfigure(1, weight=1)
-        fields_frame.grid_columnconfigure(3, weight=1)
+        fields_frame.grid_columnconfigure((1, 3), weight=1)
         
         AnimatedButton(
             form_frame,
@@ -1351,24 +1916,37 @@ class InstagramBotGUI:
         
         # Treeview для акаунтів
         columns = ('Логін', 'Проксі', 'Статус')
-        self.accounts_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=8)
-        
-        for col in columns:
-            self.accounts_tree.heading(col, text=col)
-            self.accounts_tree.column(col, width=120)
-        
-        # Стилізація Treeview
-        style = ttk.Style()
-        style.configure("Treeview", 
-                       background=ModernStyle.COLORS['background'],
-                       foreground=ModernStyle.COLORS['text'],
-                       fieldbackground=ModernStyle.COLORS['background'])
-        style.configure("Treeview.Heading", 
-                       background=ModernStyle.COLORS['card'],
-                       foreground=ModernStyle.COLORS['text'])
-        
-        scrollbar_acc = ttk.Scrollbar(list_frame, orient="vertical", command=self.accounts_tree.yview)
-        self.accounts_tree.configure(yscrollcommand=scrollbar_acc.set)
+        if USE_CANVAS_LIST:
+            self.accounts_tree = CanvasAccountList(list_frame, columns)
+            scrollbar_acc = ttk.Scrollbar(list_frame, orient="vertical", command=self.accounts_tree.yview)
+            self.accounts_tree.set_scrollbar(scrollbar_acc.set)
+        else:
+            self.accounts_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=8)
+            
+            for col in columns:
+                self.accounts_tree.heading(col, text=col)
+                self.accounts_tree.column(col, width=120)
+            
+            _ensure_styles()
+            
+            # Віртуальний список: у дереві існують лише видимі рядки (iid = username),
+            # а скролбар керує вікном напряму
+            self._acc_first = 0
+            self._acc_rendered = {}  # username (iid) -> значення, що зараз показані у рядку
+            self._acc_selected = None  # вибраний логін; пам'ятається і поза видимим вікном
+            self._acc_row_height = None
+            self._acc_header = 0
+            
+            scrollbar_acc = ttk.Scrollbar(list_frame, orient="vertical", command=self._scroll_accounts)
+            self.accounts_tree.bind('<Configure>', lambda e: self._render_window())
+            self.accounts_tree.bind('<MouseWheel>', self._on_accounts_wheel)
+            # X11 надсилає колесо як Button-4/5
+            self.accounts_tree.bind('<Button-4>', lambda e: self._scroll_accounts('scroll', -1, 'units') or 'break')
+            self.accounts_tree.bind('<Button-5>', lambda e: self._scroll_accounts('scroll', 1, 'units') or 'break')
+            self.accounts_tree.bind('<<TreeviewSelect>>', self._on_accounts_select)
+            for key in ('<Up>', '<Down>', '<Prior>', '<Next>'):
+                self.accounts_tree.bind(key, self._on_accounts_key)
+        self._acc_scrollbar = scrollbar_acc
         
         self.accounts_tree.pack(side='left', fill='both', expand=True)
         scrollbar_acc.pack(side='right', fill='y')
@@ -1380,11 +1958,10 @@ class InstagramBotGUI:
         AnimatedButton(control_frame, text="🗑️ Видалити", command=self.remove_account, bg=ModernStyle.COLORS['error']).pack(side='left', padx=5)
         AnimatedButton(control_frame, text="📁 Імпорт", command=self.import_accounts, bg=ModernStyle.COLORS['info']).pack(side='left', padx=5)
         AnimatedButton(control_frame, text="🧹 Очистити все", command=self.clear_all_accounts, bg=ModernStyle.COLORS['error']).pack(side='left', padx=5)
+        AnimatedButton(control_frame, text="▶️ Ланцюжок для всіх", command=lambda: self.run_chain_all(list(self.accounts.values())), bg=ModernStyle.COLORS['success']).pack(side='left', padx=5)
         AnimatedButton(control_frame, text="💾 Експорт", command=self.export_accounts, bg=ModernStyle.COLORS['info']).pack(side='right', padx=5)
         
-        # Ініціалізація даних
-        self.accounts = []
-        self.load_accounts()
+        self.update_accounts_display()
         
         return page
     
@@ -1395,9 +1972,7 @@ class InstagramBotGUI:
         header = tk.Label(
             page,
             text="🎯 Управління цілями",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_BG
         )
         header.pack(pady=10)
         
@@ -1449,9 +2024,7 @@ class InstagramBotGUI:
         AnimatedButton(control_frame, text="🧹 Очистити все", command=self.clear_all_targets, bg=ModernStyle.COLORS['error']).pack(side='left', padx=5)
         AnimatedButton(control_frame, text="💾 Експорт", command=self.export_targets, bg=ModernStyle.COLORS['info']).pack(side='right', padx=5)
         
-        # Ініціалізація даних
-        self.targets = []
-        self.load_targets()
+        self.update_targets_display()
         
         return page
     
@@ -1462,9 +2035,7 @@ class InstagramBotGUI:
         header = tk.Label(
             page,
             text="📝 Управління текстами",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_BG
         )
         header.pack(pady=10)
         
@@ -1484,9 +2055,8 @@ class InstagramBotGUI:
         self.create_texts_tab(stories_frame, 'story_replies')
         self.create_texts_tab(dm_frame, 'direct_messages')
         
-        # Ініціалізація даних
-        self.texts = {'story_replies': [], 'direct_messages': []}
-        self.load_texts()
+        for text_type in self.texts:
+            self.update_texts_display(text_type)
         
         return page
     
@@ -1497,9 +2067,7 @@ class InstagramBotGUI:
         header = tk.Label(
             page,
             text="🌐 Налаштування браузера",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_BG
         )
         header.pack(pady=10)
         
@@ -1510,8 +2078,6 @@ class InstagramBotGUI:
         browser_content = tk.Frame(browser_card, bg=ModernStyle.COLORS['card'])
         browser_content.pack(fill='x', padx=15, pady=(0, 15))
         
-        self.browser_var = tk.StringVar(value='chrome')
-        
         chrome_frame = tk.Frame(browser_content, bg=ModernStyle.COLORS['surface'], relief='solid', bd=1)
         chrome_frame.pack(fill='x', pady=5)
         
@@ -1541,43 +2107,33 @@ class InstagramBotGUI:
         settings_content = tk.Frame(settings_card, bg=ModernStyle.COLORS['card'])
         settings_content.pack(fill='x', padx=15, pady=(0, 15))
         
-        self.headless_var = tk.BooleanVar()
-        self.stealth_var = tk.BooleanVar(value=True)
-        self.proxy_enabled_var = tk.BooleanVar(value=True)
-        
         tk.Checkbutton(settings_content, text="Headless режим", variable=self.headless_var, **self.check_style()).pack(anchor='w', pady=2)
         tk.Checkbutton(settings_content, text="Stealth режим", variable=self.stealth_var, **self.check_style()).pack(anchor='w', pady=2)
         tk.Checkbutton(settings_content, text="Використовувати проксі", variable=self.proxy_enabled_var, **self.check_style()).pack(anchor='w', pady=2)
         
-        # Ініціалізація даних
-        self.browser_settings = {}
-        self.load_browser_settings()
         
         return page
     
     def create_run_page(self):
         """Створення оптимізованої сторінки запуску з розподілом воркерів"""
-        page = tk.Frame(self.content_area, bg=ModernStyle.COLORS['background'])
+        C, F = ModernStyle.C, ModernStyle.F
+        
+        page = tk.Frame(self.content_area, bg=C.background)
         
         # Заголовок
         header = tk.Label(
             page,
             text="▶️ Запуск автоматизації",
-            font=ModernStyle.FONTS['heading'],
-            bg=ModernStyle.COLORS['background'],
-            fg=ModernStyle.COLORS['text']
+            **HEADING_BG
         )
         header.pack(pady=(10, 15))
         
         # Скролюючий контейнер
-        canvas = tk.Canvas(page, bg=ModernStyle.COLORS['background'], highlightthickness=0)
+        canvas = tk.Canvas(page, bg=C.background, highlightthickness=0)
         scrollbar = ttk.Scrollbar(page, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=ModernStyle.COLORS['background'])
+        scrollable_frame = tk.Frame(canvas, bg=C.background)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._bind_scrollregion(scrollable_frame, canvas)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -1589,20 +2145,18 @@ class InstagramBotGUI:
         settings_card = GlassCard(scrollable_frame, title="Налаштування запуску")
         settings_card.pack(fill='x', padx=15, pady=(0, 10))
         
-        settings_content = tk.Frame(settings_card, bg=ModernStyle.COLORS['card'])
+        settings_content = tk.Frame(settings_card, bg=C.card)
         settings_content.pack(fill='x', padx=15, pady=(0, 10))
         
         # Сітка налаштувань
-        settings_grid = tk.Frame(settings_content, bg=ModernStyle.COLORS['card'])
+        settings_grid = tk.Frame(settings_content, bg=C.card)
         settings_grid.pack(fill='x', pady=5)
         
         # Кількість воркерів
         tk.Label(
             settings_grid,
             text="Воркери:",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text']
+            **LABEL_CARD
         ).grid(row=0, column=0, sticky='w', padx=(0, 10), pady=3)
         
         self.workers_var = tk.IntVar(value=3)
@@ -1612,9 +2166,7 @@ class InstagramBotGUI:
             to=10,
             width=8,
             textvariable=self.workers_var,
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text'],
+            **SPINBOX_SURFACE,
             command=self.update_worker_configs
         )
         workers_spin.grid(row=0, column=1, sticky='w', padx=(0, 20), pady=3)
@@ -1623,9 +2175,7 @@ class InstagramBotGUI:
         tk.Label(
             settings_grid,
             text="Затримка (хв):",
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['card'],
-            fg=ModernStyle.COLORS['text']
+            **LABEL_CARD
         ).grid(row=0, column=2, sticky='w', padx=(0, 10), pady=3)
         
         self.delay_var = tk.IntVar(value=5)
@@ -1635,14 +2185,12 @@ class InstagramBotGUI:
             to=60,
             width=8,
             textvariable=self.delay_var,
-            font=ModernStyle.FONTS['body'],
-            bg=ModernStyle.COLORS['surface'],
-            fg=ModernStyle.COLORS['text']
+            **SPINBOX_SURFACE
         )
         delay_spin.grid(row=0, column=3, sticky='w', pady=3)
         
         # Режим роботи  
-        mode_frame = tk.Frame(settings_grid, bg=ModernStyle.COLORS['card'])
+        mode_frame = tk.Frame(settings_grid, bg=C.card)
         mode_frame.grid(row=1, column=1, columnspan=2, sticky='w', pady=3)
         
         self.mode_var = tk.StringVar(value="continuous")
@@ -1659,8 +2207,8 @@ class InstagramBotGUI:
         mode_indicator = tk.Label(
             mode_frame,
             text="🤖 РЕАЛЬНА РОБОТА",
-            font=ModernStyle.FONTS['small'],
-            bg=ModernStyle.COLORS['success'],
+            font=F.small,
+            bg=C.success,
             fg='white',
             padx=8,
             pady=2
@@ -1672,24 +2220,24 @@ class InstagramBotGUI:
             settings_grid,
             text="🔄 Оновити конфігурацію",
             command=self.update_worker_configs,
-            bg=ModernStyle.COLORS['info']
+            bg=C.info
         ).grid(row=1, column=3, sticky='w', padx=(10, 0), pady=3)
         
         # Кнопки управління
         control_card = GlassCard(scrollable_frame, title="Управління")
         control_card.pack(fill='x', padx=15, pady=(0, 10))
         
-        control_content = tk.Frame(control_card, bg=ModernStyle.COLORS['card'])
+        control_content = tk.Frame(control_card, bg=C.card)
         control_content.pack(fill='x', padx=15, pady=(0, 10))
         
-        buttons_frame = tk.Frame(control_content, bg=ModernStyle.COLORS['card'])
+        buttons_frame = tk.Frame(control_content, bg=C.card)
         buttons_frame.pack(fill='x')
         
         self.start_btn = AnimatedButton(
             buttons_frame,
             text="▶️ Запустити",
             command=self.start_automation,
-            bg=ModernStyle.COLORS['success']
+            bg=C.success
         )
         self.start_btn.pack(side='left', padx=(0, 8))
         
@@ -1697,7 +2245,7 @@ class InstagramBotGUI:
             buttons_frame,
             text="⏹️ Зупинити",
             command=self.stop_automation,
-            bg=ModernStyle.COLORS['error'],
+            bg=C.error,
             state='disabled'
         )
         self.stop_btn.pack(side='left', padx=(0, 8))
@@ -1706,7 +2254,7 @@ class InstagramBotGUI:
             buttons_frame,
             text="⏸️ Пауза",
             command=self.pause_automation,
-            bg=ModernStyle.COLORS['warning'],
+            bg=C.warning,
             state='disabled'
         )
         self.pause_btn.pack(side='left')
@@ -1716,7 +2264,7 @@ class InstagramBotGUI:
         workers_card.pack(fill='x', padx=15, pady=(0, 10))
         
         # Контейнер для конфігурацій воркерів
-        self.workers_config_container = tk.Frame(workers_card, bg=ModernStyle.COLORS['card'])
+        self.workers_config_container = tk.Frame(workers_card, bg=C.card)
         self.workers_config_container.pack(fill='x', padx=15, pady=(0, 10))
         
         # Статус воркерів
@@ -1724,23 +2272,25 @@ class InstagramBotGUI:
         status_card.pack(fill='x', padx=15, pady=(0, 15))
         
         # Контейнер для статусу воркерів
-        status_container = tk.Frame(status_card, bg=ModernStyle.COLORS['card'], height=200)
+        status_container = tk.Frame(status_card, bg=C.card, height=200)
         status_container.pack(fill='x', padx=15, pady=(0, 10))
         status_container.pack_propagate(False)
         
         status_canvas = tk.Canvas(
             status_container,
-            bg=ModernStyle.COLORS['card'],
+            bg=C.card,
             highlightthickness=0,
             height=180
         )
         status_scrollbar = ttk.Scrollbar(status_container, orient="vertical", command=status_canvas.yview)
-        self.workers_status_container = tk.Frame(status_canvas, bg=ModernStyle.COLORS['card'])
+        self.workers_status_container = tk.Frame(status_canvas, bg=C.card)
         
-        self.workers_status_container.bind(
-            "<Configure>",
-            lambda e: status_canvas.configure(scrollregion=status_canvas.bbox("all"))
-        )
+        self._bind_scrollregion(self.workers_status_container, status_canvas)
+        
+        if USE_CANVAS_WORKERS:
+            # Усі рядки статусу - елементи одного Canvas замість дерева віджетів на воркер
+            self.workers_canvas = WorkersCanvasView(self.workers_status_container)
+            self.workers_canvas.pack(fill='x')
         
         status_canvas.create_window((0, 0), window=self.workers_status_container, anchor="nw")
         status_canvas.configure(yscrollcommand=status_scrollbar.set)
@@ -1751,16 +2301,11 @@ class InstagramBotGUI:
         # Ініціалізація конфігурації воркерів
         self.update_worker_configs()
         
-        # Прокрутка колесом миші
+        # Прокрутка колесом миші: один bind_all, активний лише поки показана ця сторінка (див. show_page)
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         
-        def bind_mousewheel(widget):
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            for child in widget.winfo_children():
-                bind_mousewheel(child)
-        
-        bind_mousewheel(page)
+        self._run_page_wheel = _on_mousewheel
         
         return page
     
@@ -1775,7 +2320,8 @@ class InstagramBotGUI:
         entry_frame = tk.Frame(input_frame, bg=ModernStyle.COLORS['card'])
         entry_frame.pack(fill='x', pady=5)
         
-        text_entry = scrolledtext.ScrolledText(entry_frame, height=3, **self.text_style())
+        # Поле на 3 рядки - звичайний Text без обгортки зі скролбаром
+        text_entry = tk.Text(entry_frame, height=3, **self.text_style())
         text_entry.pack(side='left', fill='both', expand=True)
         
         AnimatedButton(
@@ -1815,56 +2361,22 @@ class InstagramBotGUI:
     
     # Стилі для віджетів
     def label_style(self):
-        return {
-            'font': ModernStyle.FONTS['body'],
-            'bg': ModernStyle.COLORS['card'],
-            'fg': ModernStyle.COLORS['text']
-        }
+        return LABEL_CARD
     
     def entry_style(self):
-        return {
-            'font': ModernStyle.FONTS['body'],
-            'bg': ModernStyle.COLORS['surface'],
-            'fg': ModernStyle.COLORS['text'],
-            'insertbackground': ModernStyle.COLORS['text']
-        }
+        return ENTRY_SURFACE
     
     def text_style(self):
-        return {
-            'font': ModernStyle.FONTS['body'],
-            'bg': ModernStyle.COLORS['surface'],
-            'fg': ModernStyle.COLORS['text'],
-            'insertbackground': ModernStyle.COLORS['text'],
-            'wrap': tk.WORD
-        }
+        return TEXT_SURFACE
     
     def listbox_style(self):
-        return {
-            'font': ModernStyle.FONTS['body'],
-            'bg': ModernStyle.COLORS['background'],
-            'fg': ModernStyle.COLORS['text'],
-            'selectbackground': ModernStyle.COLORS['primary'],
-            'selectforeground': 'white',
-            'relief': 'flat',
-            'borderwidth': 0
-        }
+        return LISTBOX_BG
     
     def radio_style(self):
-        return {
-            'font': ModernStyle.FONTS['body'],
-            'bg': ModernStyle.COLORS['surface'],
-            'fg': ModernStyle.COLORS['text'],
-            'selectcolor': ModernStyle.COLORS['primary'],
-            'activebackground': ModernStyle.COLORS['surface']
-        }
+        return RADIO_SURFACE
     
     def check_style(self):
-        return {
-            'font': ModernStyle.FONTS['body'],
-            'bg': ModernStyle.COLORS['card'],
-            'fg': ModernStyle.COLORS['text'],
-            'selectcolor': ModernStyle.COLORS['surface']
-        }
+        return CHECK_CARD
     
     # Методи для роботи з даними
     def add_account(self):
@@ -1876,7 +2388,7 @@ class InstagramBotGUI:
             messagebox.showwarning("Попередження", "Введіть логін та пароль")
             return
         
-        if any(acc['username'] == username for acc in self.accounts):
+        if username in self.accounts:
             messagebox.showwarning("Попередження", "Акаунт вже існує")
             return
         
@@ -1888,16 +2400,16 @@ class InstagramBotGUI:
             'added_at': datetime.now().isoformat()
         }
         
-        self.accounts.append(account)
+        self.accounts[username] = account
         self.update_accounts_display()
-        self.save_accounts()
+        self._schedule_save('accounts')
         
         # Очищення полів
         self.username_var.set("")
         self.password_var.set("")
         self.proxy_var.set("")
         
-        print(f"Додано акаунт: {username}")
+        logger.debug("Додано акаунт: %s", username)
         messagebox.showinfo("Успіх", "Акаунт додано")
     
     def clear_all_accounts(self):
@@ -1911,8 +2423,9 @@ class InstagramBotGUI:
             f"Видалити всі {len(self.accounts)} акаунтів?\n\nЦю дію неможливо скасувати!"
         ):
             self.accounts.clear()
+            self._account_display.clear()
             self.update_accounts_display()
-            self.save_accounts()
+            self._schedule_save('accounts')
             
             # Оновлення конфігурації воркерів якщо ми на сторінці запуску
             try:
@@ -1924,16 +2437,16 @@ class InstagramBotGUI:
             messagebox.showinfo("Успіх", "Всі акаунти видалено")
     
     def remove_account(self):
-        selection = self.accounts_tree.selection()
+        selection = self._selected_accounts()
         if not selection:
             messagebox.showwarning("Попередження", "Виберіть акаунт")
             return
         
         if messagebox.askyesno("Підтвердження", "Видалити акаунт?"):
-            index = self.accounts_tree.index(selection[0])
-            self.accounts.pop(index)
+            del self.accounts[selection[0]]
+            self._account_display.pop(selection[0], None)
             self.update_accounts_display()
-            self.save_accounts()
+            self._schedule_save('accounts')
     
     def add_target(self):
         target = self.target_var.get().strip().replace('@', '')
@@ -1941,13 +2454,14 @@ class InstagramBotGUI:
             messagebox.showwarning("Попередження", "Введіть username")
             return
         
-        if target in self.targets:
+        if target in self._targets_set:
             messagebox.showwarning("Попередження", "Ціль вже існує")
             return
         
         self.targets.append(target)
+        self._targets_set.add(target)
         self.update_targets_display()
-        self.save_targets()
+        self._schedule_save('targets')
         self.target_var.set("")
     
     def add_bulk_targets(self):
@@ -1955,14 +2469,12 @@ class InstagramBotGUI:
         if not text:
             return
         
-        lines = text.split('\n')
-        added = 0
-        
-        for line in lines:
-            target = line.strip().replace('@', '')
-            if target and target not in self.targets:
-                self.targets.append(target)
-                added += 1
+        # dict.fromkeys прибирає повтори всередині вставленого тексту зі збереженням порядку
+        new = [target for target in dict.fromkeys(_NORMALIZE.sub('', line) for line in text.splitlines())
+               if target and target not in self._targets_set]
+        self.targets.extend(new)
+        self._targets_set.update(new)
+        added = len(new)
         
         if added > 0:
             self.update_targets_display()
@@ -1981,8 +2493,9 @@ class InstagramBotGUI:
             f"Видалити всі {len(self.targets)} цілей?\n\nЦю дію неможливо скасувати!"
         ):
             self.targets.clear()
+            self._targets_set.clear()
             self.update_targets_display()
-            self.save_targets()
+            self._schedule_save('targets')
             
             # Оновлення конфігурації воркерів якщо ми на сторінці запуску
             try:
@@ -2000,9 +2513,9 @@ class InstagramBotGUI:
             return
         
         index = selection[0]
-        self.targets.pop(index)
+        self._targets_set.discard(self.targets.pop(index))
         self.update_targets_display()
-        self.save_targets()
+        self._schedule_save('targets')
     
     def add_text(self, text_type, text_entry):
         text = text_entry.get('1.0', tk.END).strip()
@@ -2010,9 +2523,10 @@ class InstagramBotGUI:
             return
         
         self.texts[text_type].append(text)
+        self._texts_count += 1
         self.update_texts_display(text_type)
         self.save_texts()
-        text_entry.delete_entry.delete('1.0', tk.END)
+        text_entry.delete('1.0', tk.END)
     
     def remove_text(self, text_type, listbox):
         selection = listbox.curselection()
@@ -2022,127 +2536,282 @@ class InstagramBotGUI:
         
         index = selection[0]
         self.texts[text_type].pop(index)
+        self._texts_count -= 1
         self.update_texts_display(text_type)
         self.save_texts()
     
     # Методи оновлення відображення
     def update_accounts_display(self):
-        # Очищення таблиці
-        for item in self.accounts_tree.get_children():
-            self.accounts_tree.delete(item)
-        
-        print(f"Оновлення відображення для {len(self.accounts)} акаунтів")
-        
-        # Додавання акаунтів
-        for account in self.accounts:
-            proxy_display = (account.get('proxy', 'Немає') or 'Немає')
-            if len(proxy_display) > 15:
-                proxy_display = proxy_display[:15] + "..."
-            
-            self.accounts_tree.insert('', 'end', values=(
-                account['username'],
-                proxy_display,
-                account.get('status', 'active')
-            ))
+        self.invalidate('accounts')
+        if not hasattr(self, 'accounts_tree'):
+            return
+        logger.debug("Оновлення відображення для %d акаунтів", len(self.accounts))
+        if USE_CANVAS_LIST:
+            self.accounts_tree.show(self.accounts, self._account_row)
+        else:
+            self._render_window()
+    
+    def _account_row(self, account):
+        """Значення рядка таблиці для акаунту (кеш перебудовується, щойно змінились проксі чи статус)"""
+        username = account['username']
+        proxy, status = account.get('proxy'), account.get('status', 'active')
+        cached = self._account_display.get(username)
+        if cached is not None and cached[0] == proxy and cached[1] == status:
+            return cached[2]
+        p = proxy or 'Немає'
+        values = (username, p[:15] + "..." if len(p) > 15 else p, status)
+        self._account_display[username] = (proxy, status, values)
+        return values
+    
+    def _accounts_visible_rows(self):
+        """Кількість повних рядків, що вміщаються у видиму область таблиці"""
+        tree = self.accounts_tree
+        if self._acc_row_height is None:
+            children = tree.get_children()
+            bbox = tree.bbox(children[0]) if children else ''
+            if not bbox:
+                return int(tree.cget('height'))
+            self._acc_header, self._acc_row_height = bbox[1], bbox[3]
+        return max(1, (tree.winfo_height() - self._acc_header) // self._acc_row_height)
+    
+    def _render_window(self):
+        """Відображення лише видимого вікна акаунтів: вставка/видалення тільки різниці"""
+        tree = self.accounts_tree
+        total = len(self.accounts)
+        rows = self._accounts_visible_rows()
+        first = self._acc_first = max(0, min(self._acc_first, total - rows))
+        window = list(islice(self.accounts.items(), first, first + rows))
+        
+        rendered = self._acc_rendered
+        stale = rendered.keys() - {username for username, _ in window}
+        if stale:
+            tree.delete(*stale)
+            for username in stale:
+                del rendered[username]
+        
+        insert, item, row = tree.insert, tree.item, self._account_row
+        for position, (username, account) in enumerate(window):
+            values = row(account)
+            shown = rendered.get(username)
+            if shown is None:
+                insert('', position, iid=username, values=values)
+            elif shown != values:
+                item(username, values=values)
+            rendered[username] = values
+        
+        # Рядок вибору міг бути видалений при прокрутці - повертаємо вибір за iid
+        selected = self._acc_selected
+        if selected in rendered and tree.selection() != (selected,):
+            tree.selection_set(selected)
+            tree.focus(selected)
+        
+        if total:
+            self._acc_scrollbar.set(first / total, (first + len(window)) / total)
+        else:
+            self._acc_scrollbar.set(0, 1)
+    
+    def _scroll_accounts(self, *args):
+        """Команда скролбара таблиці акаунтів (moveto / scroll)"""
+        if args[0] == 'moveto':
+            self._acc_first = int(float(args[1]) * len(self.accounts))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._accounts_visible_rows()
+            self._acc_first += step
+        self._render_window()
+    
+    def _on_accounts_wheel(self, event):
+        self._scroll_accounts('scroll', int(-1*(event.delta/120)) or (-1 if event.delta > 0 else 1), 'units')
+        return 'break'
+    
+    def _on_accounts_select(self, event):
+        # Порожній вибір приходить і тоді, коли вибраний рядок вийшов з вікна - його ігноруємо
+        selection = self.accounts_tree.selection()
+        if selection:
+            self._acc_selected = selection[0]
+    
+    def _on_accounts_key(self, event):
+        """Рух вибору клавішами по всьому списку, а не лише по видимому вікну"""
+        total = len(self.accounts)
+        if not total:
+            return 'break'
+        rows = self._accounts_visible_rows()
+        step = {'Up': -1, 'Down': 1, 'Prior': -rows, 'Next': rows}[event.keysym]
+        
+        selected = self._acc_selected
+        if selected in self._acc_rendered:
+            index = self._acc_first + self.accounts_tree.index(selected) + step
+        elif selected in self.accounts:
+            index = list(self.accounts).index(selected) + step
+        else:
+            index = self._acc_first
+        index = max(0, min(index, total - 1))
+        
+        self._acc_selected = next(islice(self.accounts, index, None))
+        if index < self._acc_first:
+            self._acc_first = index
+        elif index >= self._acc_first + rows:
+            self._acc_first = index - rows + 1
+        self._render_window()
+        return 'break'
+    
+    def _selected_accounts(self):
+        """Вибрані логіни таблиці акаунтів"""
+        if USE_CANVAS_LIST:
+            return self.accounts_tree.selection()
+        return (self._acc_selected,) if self._acc_selected in self.accounts else ()
     
     def update_targets_display(self):
-        self.targets_listbox.delete(0, tk.END)
-        for i, target in enumerate(self.targets):
-            self.targets_listbox.insert(tk.END, f"{i+1}. @{target}")
+        self.invalidate('targets')
+        if not hasattr(self, 'targets_listbox'):
+            return
+        # Перемальовується лише хвіст після спільного з поточним вмістом префіксу
+        items = [f"{i+1}. @{target}" for i, target in enumerate(self.targets)]
+        shown = self.targets_listbox.get(0, tk.END)
+        
+        common = 0
+        for old, new in zip(shown, items):
+            if old != new:
+                break
+            common += 1
+        
+        if common < len(shown):
+            self.targets_listbox.delete(common, tk.END)
+        if common < len(items):
+            self.targets_listbox.insert(tk.END, *items[common:])
     
     def update_texts_display(self, text_type):
+        self.invalidate('texts')
         listbox = getattr(self, f'{text_type}_listbox', None)
         if listbox:
+            items = [f"{i+1}. {_shorten(text)}" for i, text in enumerate(self.texts[text_type])]
             listbox.delete(0, tk.END)
-            for i, text in enumerate(self.texts[text_type]):
-                display_text = text[:40] + "..." if len(text) > 40 else text
-                display_text = display_text.replace('\n', ' ')
-                listbox.insert(tk.END, f"{i+1}. {display_text}")
+            if items:
+                listbox.insert(tk.END, *items)
     
     # Методи збереження/завантаження
+    def _schedule_save(self, kind):
+        """Відкладене збереження: серія змін за 300 мс дає один запис файлу"""
+        after_id = self._pending_saves.pop(kind, None)
+        if after_id:
+            self.root.after_cancel(after_id)
+        self._pending_saves[kind] = self.root.after(300, self._do_save, kind)
+    
+    def _do_save(self, kind):
+        self._pending_saves.pop(kind, None)
+        getattr(self, f'save_{kind}')()
+    
+    def _flush_saves(self):
+        """Негайне виконання всіх відкладених збережень"""
+        for kind, after_id in list(self._pending_saves.items()):
+            self.root.after_cancel(after_id)
+            self._do_save(kind)
+    
+    def _write_in_background(self, path, data, error_message):
+        """Запис знімка даних у фоновому потоці; помилка показується з головного потоку"""
+        def _report(future):
+            if future.exception():
+                messagebox.showerror("Помилка", f"{error_message}: {future.exception()}")
+        
+        future = _submit_write(path, data)
+        if future is not None:
+            _when_done(self.root, future, _report)
+    
     def save_accounts(self):
         try:
-            os.makedirs('data', exist_ok=True)
-            with open('data/accounts.json', 'w', encoding='utf-8') as f:
-                json.dump(self.accounts, f, indent=2, ensure_ascii=False)
+            self._write_in_background('data/accounts.json', list(self.accounts.values()), "Не вдалося зберегти акаунти")
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося зберегти акаунти: {e}")
     
     def load_accounts(self):
         try:
             if os.path.exists('data/accounts.json'):
-                with open('data/accounts.json', 'r', encoding='utf-8') as f:
-                    self.accounts = json.load(f)
-                print(f"Завантажено {len(self.accounts)} акаунтів")
-                self.update_accounts_display()
+                self.accounts = {acc['username']: acc for acc in _read_json('data/accounts.json')}
+                self._account_display = {}
+                self.invalidate('accounts')
+                logger.debug("Завантажено %d акаунтів", len(self.accounts))
+                # Перше відображення - після побудови інтерфейсу, а не на шляху запуску
+                self.root.after_idle(self.update_accounts_display)
             else:
-                print("Файл accounts.json не знайдено")
-                self.accounts = []
-        except Exception as e:
-            print(f"Помилка завантаження акаунтів: {e}")
-            self.accounts = []
+                logger.debug("Файл accounts.json не знайдено")
+                self.accounts = {}
+        except Exception:
+            logger.exception("Помилка завантаження акаунтів")
+            self.accounts = {}
     
     def save_targets(self):
         try:
-            os.makedirs('data', exist_ok=True)
-            with open('data/targets.json', 'w', encoding='utf-8') as f:
-                json.dump(self.targets, f, indent=2, ensure_ascii=False)
+            self._write_in_background('data/targets.json', list(self.targets), "Не вдалося зберегти цілі")
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося зберегти цілі: {e}")
     
     def load_targets(self):
         try:
             if os.path.exists('data/targets.json'):
-                with open('data/targets.json', 'r', encoding='utf-8') as f:
-                    self.targets = json.load(f)
-                self.update_targets_display()
-        except Exception as e:
-            print(f"Помилка завантаження цілей: {e}")
+                self.targets = _read_json('data/targets.json')
+                self._targets_set = set(self.targets)
+                self.invalidate('targets')
+                self.root.after_idle(self.update_targets_display)
+        except Exception:
+            logger.exception("Помилка завантаження цілей")
     
     def save_texts(self):
         try:
-            os.makedirs('data', exist_ok=True)
-            with open('data/texts.json', 'w', encoding='utf-8') as f:
-                json.dump(self.texts, f, indent=2, ensure_ascii=False)
+            self._write_in_background('data/texts.json', {key: list(value) for key, value in self.texts.items()},
+                                      "Не вдалося зберегти тексти")
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося зберегти тексти: {e}")
     
     def load_texts(self):
         try:
             if os.path.exists('data/texts.json'):
-                with open('data/texts.json', 'r', encoding='utf-8') as f:
-                    self.texts = json.load(f)
+                self.texts = _read_json('data/texts.json')
+                self._texts_count = sum(map(len, self.texts.values()))
                 for text_type in self.texts:
                     self.update_texts_display(text_type)
-        except Exception as e:
-            print(f"Помилка завантаження текстів: {e}")
+        except Exception:
+            logger.exception("Помилка завантаження текстів")
+    
+    def _browser_settings_changed(self, *args):
+        """Автозбереження налаштувань браузера з відкладеним записом"""
+        self._schedule_save('browser_settings')
     
     def save_browser_settings(self):
         try:
-            self.browser_settings = {
-                'browser_type': self.browser_var.get(),
-                'headless': self.headless_var.get(),
-                'stealth_mode': self.stealth_var.get(),
-                'proxy_enabled': self.proxy_enabled_var.get()
-            }
-            os.makedirs('data', exist_ok=True)
-            with open('data/browser_settings.json', 'w', encoding='utf-8') as f:
-                json.dump(self.browser_settings, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Помилка збереження налаштувань браузера: {e}")
+            # Словник оновлюється на місці; без змін значень не потрібні ні кодування, ні запис
+            settings = self.browser_settings
+            dirty = self._last_browser_blob is None
+            for key, var in self._browser_fields:
+                value = var.get()
+                if key not in settings or settings[key] != value:
+                    settings[key] = value
+                    dirty = True
+            if not dirty:
+                return
+            
+            blob = _dumps_compact(settings)
+            if blob == self._last_browser_blob:
+                return
+            
+            self._write_in_background(self._settings_path, blob,
+                                      "Не вдалося зберегти налаштування браузера")
+            self._last_browser_blob = blob
+        except Exception:
+            logger.exception("Помилка збереження налаштувань браузера")
     
     def load_browser_settings(self):
         try:
-            if os.path.exists('data/browser_settings.json'):
-                with open('data/browser_settings.json', 'r', encoding='utf-8') as f:
-                    self.browser_settings = json.load(f)
+            if os.path.exists(self._settings_path):
+                self.browser_settings = _read_json(self._settings_path)
+                self._last_browser_blob = _dumps_compact(self.browser_settings)
                     
                 self.browser_var.set(self.browser_settings.get('browser_type', 'chrome'))
                 self.headless_var.set(self.browser_settings.get('headless', False))
                 self.stealth_var.set(self.browser_settings.get('stealth_mode', True))
                 self.proxy_enabled_var.set(self.browser_settings.get('proxy_enabled', True))
-        except Exception as e:
-            print(f"Помилка завантаження налаштувань браузера: {e}")
+        except Exception:
+            logger.exception("Помилка завантаження налаштувань браузера")
     
     # Методи імпорту/експорту
     def import_accounts(self):
@@ -2153,50 +2822,26 @@ class InstagramBotGUI:
         if not filename:
             return
         
+        _when_done(self.root, _IO_EXECUTOR.submit(_parse_accounts_file, filename), self._apply_imported_accounts)
+    
+    def _apply_imported_accounts(self, future):
+        """Додавання розібраних у фоні акаунтів (лише в головному потоці)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                if filename.endswith('.json'):
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        imported = 0
-                        for account_data in data:
-                            if isinstance(account_data, dict) and 'username' in account_data and 'password' in account_data:
-                                exists = any(acc['username'] == account_data['username'] for acc in self.accounts)
-                                if not exists:
-                                    self.accounts.append({
-                                        'username': account_data['username'],
-                                        'password': account_data['password'],
-                                        'proxy': account_data.get('proxy'),
-                                        'status': 'active',
-                                        'added_at': datetime.now().isoformat()
-                                    })
-                                    imported += 1
-                else:
-                    lines = f.readlines()
-                    imported = 0
-                    for line in lines:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                username = parts[0]
-                                password = parts[1]
-                                proxy = ':'.join(parts[2:]) if len(parts) > 2 else None
-                                
-                                exists = any(acc['username'] == username for acc in self.accounts)
-                                if not exists:
-                                    self.accounts.append({
-                                        'username': username,
-                                        'password': password,
-                                        'proxy': proxy,
-                                        'status': 'active',
-                                        'added_at': datetime.now().isoformat()
-                                    })
-                                    imported += 1
-                
-                self.update_accounts_display()
-                self.save_accounts()
-                messagebox.showinfo("Успіх", f"Імпортовано {imported} акаунтів")
+            new_rows = {}
+            for username, password, proxy in future.result():
+                if username not in self.accounts and username not in new_rows:
+                    new_rows[username] = {
+                        'username': username,
+                        'password': password,
+                        'proxy': proxy,
+                        'status': 'active',
+                        'added_at': datetime.now().isoformat()
+                    }
+            
+            self.accounts.update(new_rows)
+            self.update_accounts_display()
+            self.save_accounts()
+            messagebox.showinfo("Успіх", f"Імпортовано {len(new_rows)} акаунтів")
                 
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося імпортувати: {e}")
@@ -2217,13 +2862,9 @@ class InstagramBotGUI:
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 if filename.endswith('.json'):
-                    json.dump(self.accounts, f, indent=2, ensure_ascii=False)
+                    f.write(_dumps(list(self.accounts.values())).decode('utf-8'))
                 else:
-                    for account in self.accounts:
-                        line = f"{account['username']}:{account['password']}"
-                        if account.get('proxy'):
-                            line += f":{account['proxy']}"
-                        f.write(line + '\n')
+                    f.writelines(_format_account_line(account) for account in self.accounts.values())
             
             messagebox.showinfo("Успіх", f"Акаунти експортовано: {filename}")
             
@@ -2238,29 +2879,18 @@ class InstagramBotGUI:
         if not filename:
             return
         
+        _when_done(self.root, _IO_EXECUTOR.submit(_parse_targets_file, filename), self._apply_imported_targets)
+    
+    def _apply_imported_targets(self, future):
+        """Додавання розібраних у фоні цілей (лише в головному потоці)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                if filename.endswith('.json'):
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        imported = 0
-                        for target in data:
-                            target = str(target).strip().replace('@', '')
-                            if target and target not in self.targets:
-                                self.targets.append(target)
-                                imported += 1
-                else:
-                    lines = f.readlines()
-                    imported = 0
-                    for line in lines:
-                        target = line.strip().replace('@', '')
-                        if target and not target.startswith('#') and target not in self.targets:
-                            self.targets.append(target)
-                            imported += 1
-                
-                self.update_targets_display()
-                self.save_targets()
-                messagebox.showinfo("Успіх", f"Імпортовано {imported} цілей")
+            new = [target for target in dict.fromkeys(future.result()) if target not in self._targets_set]
+            self.targets.extend(new)
+            self._targets_set.update(new)
+            
+            self.update_targets_display()
+            self.save_targets()
+            messagebox.showinfo("Успіх", f"Імпортовано {len(new)} цілей")
                 
         except Exception as e:
             messagebox.showerror("Помилка", f"Не вдалося імпортувати: {e}")
@@ -2281,10 +2911,9 @@ class InstagramBotGUI:
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 if filename.endswith('.json'):
-                    json.dump(self.targets, f, indent=2, ensure_ascii=False)
+                    f.write(_dumps(self.targets).decode('utf-8'))
                 else:
-                    for target in self.targets:
-                        f.write(target + '\n')
+                    f.writelines(target + '\n' for target in self.targets)
             
             messagebox.showinfo("Успіх", f"Цілі експортовано: {filename}")
             
@@ -2294,6 +2923,8 @@ class InstagramBotGUI:
     # Методи для роботи з воркерами
     def update_worker_configs(self):
         """Оновлення конфігурації воркерів"""
+        if not hasattr(self, 'workers_config_container'):
+            return  # Сторінка запуску ще не побудована
         try:
             # Отримання даних
             accounts = self.get_accounts_data()
@@ -2301,17 +2932,23 @@ class InstagramBotGUI:
             chain = self.get_chain_data()
             workers_count = self.workers_var.get()
             
-            print(f"Оновлення воркерів: {len(accounts)} акаунтів, {workers_count} воркерів")
+            logger.debug("Оновлення воркерів: %d акаунтів, %d воркерів", len(accounts), workers_count)
             
             # Очищення існуючих конфігурацій
             for widget in self.worker_configs:
                 widget.destroy()
             self.worker_configs.clear()
             
-            # Очищення статусних віджетів
-            for widget in self.worker_widgets:
-                widget.destroy()
-            self.worker_widgets.clear()
+            # Статусні віджети не залежать від даних, тож не знищуються: зайві ховаються
+            # в пул (за зростанням worker_id) і повертаються звідти при збільшенні кількості
+            if USE_CANVAS_WORKERS:
+                self.worker_widgets = self.workers_canvas.set_count(workers_count)
+            else:
+                surplus = self.worker_widgets[workers_count:]
+                for widget in surplus:
+                    widget.pack_forget()
+                self._widget_pool[:0] = surplus
+                del self.worker_widgets[workers_count:]
             
             # Створення нових конфігурацій воркерів
             for i in range(workers_count):
@@ -2327,9 +2964,14 @@ class InstagramBotGUI:
                 self.worker_configs.append(worker_config)
                 
                 # Статус воркера
-                worker_status = CompactWorkerStatusWidget(self.workers_status_container, i)
-                worker_status.pack(fill='x', pady=2)
-                self.worker_widgets.append(worker_status)
+                if i >= len(self.worker_widgets):
+                    if self._widget_pool:
+                        worker_status = self._widget_pool.pop(0)
+                        worker_status.reset()
+                    else:
+                        worker_status = CompactWorkerStatusWidget(self.workers_status_container, i)
+                    worker_status.pack(fill='x', pady=2)
+                    self.worker_widgets.append(worker_status)
             
             # Повідомлення якщо немає достатньо акаунтів
             if len(accounts) < workers_count:
@@ -2348,20 +2990,19 @@ class InstagramBotGUI:
         try:
             # Спробуємо отримати з головного об'єкта
             if hasattr(self, 'accounts') and self.accounts:
-                print(f"Отримано {len(self.accounts)} акаунтів з головного об'єкта")
-                return self.accounts
+                logger.debug("Отримано %d акаунтів з головного об'єкта", len(self.accounts))
+                return list(self.accounts.values())
             
             # Якщо і це не працює, завантажимо напряму
             if os.path.exists('data/accounts.json'):
-                with open('data/accounts.json', 'r', encoding='utf-8') as f:
-                    accounts = json.load(f)
-                    print(f"Завантажено {len(accounts)} акаунтів з файлу")
-                    return accounts
+                accounts = _read_json('data/accounts.json')
+                logger.debug("Завантажено %d акаунтів з файлу", len(accounts))
+                return accounts
             
-            print("Акаунти не знайдено")
+            logger.debug("Акаунти не знайдено")
             return []
-        except Exception as e:
-            print(f"Помилка отримання акаунтів: {e}")
+        except Exception:
+            logger.exception("Помилка отримання акаунтів")
             return []
     
     def get_targets_data(self):
@@ -2369,20 +3010,19 @@ class InstagramBotGUI:
         try:
             # Спробуємо отримати з головного об'єкта
             if hasattr(self, 'targets') and self.targets:
-                print(f"Отримано {len(self.targets)} цілей з головного об'єкта")
+                logger.debug("Отримано %d цілей з головного об'єкта", len(self.targets))
                 return self.targets
             
             # Якщо і це не працює, завантажимо напряму
             if os.path.exists('data/targets.json'):
-                with open('data/targets.json', 'r', encoding='utf-8') as f:
-                    targets = json.load(f)
-                    print(f"Завантажено {len(targets)} цілей з файлу")
-                    return targets
+                targets = _read_json('data/targets.json')
+                logger.debug("Завантажено %d цілей з файлу", len(targets))
+                return targets
             
-            print("Цілі не знайдено")
+            logger.debug("Цілі не знайдено")
             return []
-        except Exception as e:
-            print(f"Помилка отримання цілей: {e}")
+        except Exception:
+            logger.exception("Помилка отримання цілей")
             return []
     
     def get_chain_data(self):
@@ -2391,26 +3031,133 @@ class InstagramBotGUI:
             # Спробуємо отримати з сторінки ланцюжка
             if hasattr(self.pages.get("chain"), 'get_chain'):
                 chain = self.pages["chain"].get_chain()
-                print(f"Отримано ланцюжок з {len(chain)} дій зі сторінки")
-                if chain:
+                logger.debug("Отримано ланцюжок з %d дій зі сторінки", len(chain))
+                if logger.isEnabledFor(logging.DEBUG):
                     for i, action in enumerate(chain):
-                        print(f"  Дія {i+1}: {action.get('name', action.get('type'))}")
+                        logger.debug("  Дія %d: %s", i + 1, action.get('name', action.get('type')))
                 return chain
             
             # Спробуємо завантажити з файлу
             if os.path.exists('data/action_chain.json'):
-                with open('data/action_chain.json', 'r', encoding='utf-8') as f:
-                    chain = json.load(f)
-                    enabled_chain = [action for action in chain if action.get('enabled', True)]
-                    print(f"Завантажено ланцюжок з {len(enabled_chain)} дій з файлу")
-                    return enabled_chain
+                chain = _read_json('data/action_chain.json')
+                enabled_chain = [action for action in chain if action.get('enabled', True)]
+                logger.debug("Завантажено ланцюжок з %d дій з файлу", len(enabled_chain))
+                return enabled_chain
             
-            print("❌ Ланцюжок дій не знайдено")
+            logger.debug("Ланцюжок дій не знайдено")
             return []
-        except Exception as e:
-            print(f"❌ Помилка отримання ланцюжка: {e}")
+        except Exception:
+            logger.exception("Помилка отримання ланцюжка")
             return []
     
+    def run_chain_all(self, accounts):
+        """Паралельний запуск ланцюжка для кожного акаунту (не більше MAX_PARALLEL_ACCOUNTS браузерів)"""
+        if self._fan_out_active:
+            self._flash_status("Ланцюжок для акаунтів уже виконується", ModernStyle.COLORS['warning'])
+            return
+        
+        chain = self.get_chain_data()
+        targets = self.get_targets_data()
+        for failed, message in (
+            (not accounts, "Додайте хоча б один акаунт"),
+            (not targets, "Додайте хоча б одну ціль"),
+            (not chain, "Створіть ланцюжок дій"),
+        ):
+            if failed:
+                self._flash_status(message, ModernStyle.COLORS['warning'])
+                return
+        
+        self.save_browser_settings()
+        settings = self.browser_settings
+        bot_config = BotConfig()
+        config = {
+            'browser_settings': {
+                'type': settings.get('browser_type', 'chrome'),
+                'headless': settings.get('headless', False),
+                'stealth_mode': settings.get('stealth_mode', True),
+                'proxy_enabled': settings.get('proxy_enabled', True),
+                'timeout': 30000
+            },
+            'selectors': bot_config.get_selectors(),
+            'action_delays': bot_config.get_action_delays(),
+            'safety_limits': bot_config.get_safety_limits()
+        }
+        
+        # Знімок текстів: GUI може змінювати self.texts, поки працюють потоки
+        texts = {text_type: list(items) for text_type, items in self.texts.items()}
+        workers = min(MAX_PARALLEL_ACCOUNTS, len(accounts))
+        # Вільні номери віджетів статусу: кожен браузер показується у своєму слоті
+        slots = queue.Queue()
+        for worker_id in range(workers):
+            slots.put(worker_id)
+        
+        self._fan_out_stop.clear()
+        self._fan_out_automations = []
+        self._fan_out_active = True
+        self._flash_status(f"▶️ Ланцюжок для {len(accounts)} акаунтів", ModernStyle.COLORS['success'])
+        
+        def fan_out():
+            # IO-bound робота: браузер і мережа, тому потоки перекривають очікування;
+            # кожен потік - окремий браузер, тож паралелізм обмежений
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futs = {ex.submit(self._run_one, acc, chain, targets, texts, config, slots): acc for acc in accounts}
+                for f in as_completed(futs):
+                    try:
+                        result = f.result()
+                    except Exception as e:
+                        result = e
+                    # Tk не потокобезпечний - результат іде через чергу подій;
+                    # блокуючий put: звіти, на відміну від проміжних статусів, не відкидаються
+                    self._event_q.put(('report', futs[f], result))
+            self._event_q.put(('fan_out_done',))
+        
+        threading.Thread(target=fan_out, daemon=True).start()
+    
+    def _fan_out_finished(self):
+        self._fan_out_active = False
+        self._flash_status("Ланцюжок для всіх акаунтів завершено", ModernStyle.COLORS['text_secondary'])
+    
+    def _stop_fan_out(self):
+        """Зупинка браузерів run_chain_all; акаунти з черги вже не запускаються"""
+        with self._fan_out_lock:
+            self._fan_out_stop.set()
+            for automation in self._fan_out_automations:
+                automation.running = False
+    
+    def _run_one(self, account, chain, targets, texts, config, slots):
+        """Виконання ланцюжка для одного акаунту у власному event loop"""
+        if self._fan_out_stop.is_set():
+            return None
+        
+        async def run(worker_id):
+            async with _automation_engine().InstagramAutomation(config) as automation:
+                with self._fan_out_lock:
+                    if self._fan_out_stop.is_set():
+                        return None
+                    automation.running = True
+                    self._fan_out_automations.append(automation)
+                return await automation.run_account_automation(
+                    account, targets, chain, texts, worker_id, self.update_worker_status
+                )
+        
+        worker_id = slots.get()
+        try:
+            return asyncio.run(run(worker_id))
+        finally:
+            slots.put(worker_id)
+    
+    def _report(self, account, result):
+        """Відображення результату обробки акаунту"""
+        username = account.get('username')
+        if result is None:
+            logger.info("Акаунт %s пропущено: ланцюжок зупинено", username)
+        elif isinstance(result, Exception):
+            logger.error("Помилка обробки акаунту %s: %s", username, result)
+            self.status_label.configure(text=f"● Помилка: {username}", fg=ModernStyle.COLORS['error'])
+        else:
+            logger.info("Акаунт %s оброблено: %d успішних дій", username, result.get('successful_actions', 0))
+            self.status_label.configure(text=f"● Оброблено: {username}", fg=ModernStyle.COLORS['success'])
+    
     # Методи управління автоматизацією
     def start_automation(self):
      """Запуск РЕАЛЬНОЇ автоматизації з браузерами"""
@@ -2423,38 +3170,32 @@ class InstagramBotGUI:
         targets = self.get_targets_data()
         chain = self.get_chain_data()
         
-        if not accounts:
-            messagebox.showwarning("Попередження", "Додайте хоча б один акаунт")
-            return
-        
-        if not targets:
-            messagebox.showwarning("Попередження", "Додайте хоча б одну ціль")
-            return
-        
-        if not chain:
-            messagebox.showwarning("Попередження", "Створіть ланцюжок дій")
-            return
-        
-        # Отримання конфігурацій воркерів
-        worker_configs = []
-        for worker_config in self.worker_configs:
-            config = worker_config.get_config()
-            if config:  # Тільки увімкнені воркери
-                worker_configs.append(config)
+        # Конфігурації лише увімкнених воркерів
+        worker_configs = [config for config in (widget.get_config() for widget in self.worker_configs) if config]
         
-        if not worker_configs:
-            messagebox.showwarning("Попередження", "Увімкніть хоча б один воркер")
-            return
+        # Перевірки одним проходом: показується перша невиконана умова
+        for failed, message in (
+            (not accounts, "Додайте хоча б один акаунт"),
+            (not targets, "Додайте хоча б одну ціль"),
+            (not chain, "Створіть ланцюжок дій"),
+            (not worker_configs, "Увімкніть хоча б один воркер"),
+        ):
+            if failed:
+                self._flash_status(message, ModernStyle.COLORS['warning'])
+                return
         
         # Перевірка що у всіх воркерів є акаунти
-        for config in worker_configs:
-            if not config['account']:
-                messagebox.showwarning("Попередження", f"Воркер #{config['worker_id'] + 1} не має акаунту")
-                return
+        without_account = next((config for config in worker_configs if not config['account']), None)
+        if without_account:
+            self._flash_status(f"Воркер #{without_account['worker_id'] + 1} не має акаунту",
+                               ModernStyle.COLORS['warning'])
+            return
         
         print("🚀 Використовується РЕАЛЬНА автоматизація з браузерами!")
         
         # ВИПРАВЛЕНА конфігурація для automation_engine
+        settings = self.browser_settings
+        bot_config = BotConfig()
         automation_config = {
             'accounts': accounts,
             'targets': targets,
@@ -2464,15 +3205,15 @@ class InstagramBotGUI:
             'delay_minutes': self.delay_var.get(),
             'mode': self.mode_var.get(),
             'browser_settings': {
-                'type': self.browser_settings.get('browser_type', 'chrome'),
-                'headless': self.browser_settings.get('headless', False),
-                'stealth_mode': self.browser_settings.get('stealth_mode', True),
-                'proxy_enabled': self.browser_settings.get('proxy_enabled', True),
+                'type': settings.get('browser_type', 'chrome'),
+                'headless': settings.get('headless', False),
+                'stealth_mode': settings.get('stealth_mode', True),
+                'proxy_enabled': settings.get('proxy_enabled', True),
                 'timeout': 30000
             },
-            'selectors': BotConfig().get_selectors(),
-            'action_delays': BotConfig().get_action_delays(),
-            'safety_limits': BotConfig().get_safety_limits(),
+            'selectors': bot_config.get_selectors(),
+            'action_delays': bot_config.get_action_delays(),
+            'safety_limits': bot_config.get_safety_limits(),
             # ДОДАЄМО worker_configs для сумісності
             'worker_configs': worker_configs
         }
@@ -2497,7 +3238,7 @@ class InstagramBotGUI:
                 account_name = config['account']['username']
                 self.worker_widgets[i].update_status('working', f"Підготовка", account_name)
         
-        messagebox.showinfo("Запуск", f"🚀 РЕАЛЬНА автоматизація запущена з {len(worker_configs)} воркерами!")
+        self._flash_status(f"🚀 Запущено воркерів: {len(worker_configs)}", ModernStyle.COLORS['success'])
         
      except Exception as e:
         messagebox.showerror("Помилка", f"Помилка запуску автоматизації: {e}")
@@ -2508,6 +3249,7 @@ class InstagramBotGUI:
         """Зупинка автоматизації"""
         if self.automation_manager:
             self.automation_manager.stop_automation()
+        self._stop_fan_out()
         
         # Оновлення статусу воркерів
         for widget in self.worker_widgets:
@@ -2518,8 +3260,7 @@ class InstagramBotGUI:
         self.stop_btn.configure(state='disabled')
         self.pause_btn.configure(state='disabled')
         self.status_label.configure(text="● Готовий", fg=ModernStyle.COLORS['success'])
-        
-        messagebox.showinfo("Інформація", "Автоматизація зупинена")
+        self._flash_status("Автоматизація зупинена", ModernStyle.COLORS['text_secondary'])
     
     def pause_automation(self):
         """Пауза автоматизації"""
@@ -2532,17 +3273,84 @@ class InstagramBotGUI:
                 widget.update_status('paused')
         
         self.status_label.configure(text="● На паузі", fg=ModernStyle.COLORS['warning'])
-        messagebox.showinfo("Інформація", "Автоматизація поставлена на паузу")
+        self._flash_status("Автоматизація поставлена на паузу", ModernStyle.COLORS['warning'])
+    
+    def _flash_status(self, text, color, ms=3000):
+        """Тимчасове повідомлення під статусом у бічній панелі (без модального вікна)"""
+        if self._flash_after is not None:
+            self.root.after_cancel(self._flash_after)
+        self.status_message.configure(text=text, fg=color)
+        self._flash_after = self.root.after(ms, self._clear_flash)
+    
+    def _clear_flash(self):
+        self._flash_after = None
+        self.status_message.configure(text="")
     
     def update_worker_status(self, worker_id, status, current_target=None, account=None, stats=None):
-        """Оновлення статусу воркера"""
+        """Оновлення статусу воркера (викликається з потоку автоматизації, Tk не торкається)"""
         try:
-            if worker_id < len(self.worker_widgets):
-                self.worker_widgets[worker_id].update_status(status, current_target, account)
-                if stats:
-                    self.worker_widgets[worker_id].update_stats(stats)
-        except Exception as e:
-            print(f"Помилка оновлення статусу воркера {worker_id}: {e}")
+            self._event_q.put_nowait((worker_id, status, current_target, account, stats))
+        except queue.Full:
+            pass  # Черга переповнена - проміжний статус відкидається
+    
+    def _drain_events(self):
+        """Розбір черги подій воркерів у головному потоці"""
+        # Наступний прохід плануємо одразу: виняток у віджеті не зупинить опитування черги
+        self.root.after(50, self._drain_events)
+        
+        updates = {}
+        # Не більше однієї повної черги за прохід, щоб потік-виробник не утримав цикл
+        for _ in range(self._event_q.maxsize):
+            try:
+                event = self._event_q.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == 'report':
+                self._report(*event[1:])
+                continue
+            if event[0] == 'fan_out_done':
+                self._fan_out_finished()
+                continue
+            worker_id, status, current_target, account, stats = event
+            pending = updates.get(worker_id)
+            if pending and pending[3]:
+                # Статистика, що ще не потрапила на екран, доповнюється новою
+                stats = {**pending[3], **(stats or {})}
+            updates[worker_id] = (status, current_target, account, stats)
+        
+        for worker_id, update in updates.items():
+            self._apply_worker_status(worker_id, *update)
+        
+        # Одне примусове оброблення простою на пакет: відкладені _flush віджетів,
+        # перекомпонування і перемальовування відбуваються разом
+        if updates and hasattr(self, 'workers_status_container'):
+            self.workers_status_container.update_idletasks()
+    
+    def _apply_worker_status(self, worker_id, status, current_target=None, account=None, stats=None):
+        """Застосування статусу до віджета воркера (лише в головному потоці)"""
+        if not 0 <= worker_id < len(self.worker_widgets):
+            logger.debug("Статус для воркера %s без віджета відкинуто", worker_id)
+            return
+        widget = self.worker_widgets[worker_id]
+        widget.update_status(status, current_target, account)
+        if stats:
+            widget.update_stats(stats)
+    
+    def _bind_scrollregion(self, frame, canvas):
+        """Відкладене оновлення області прокрутки: пакет <Configure> дає один перерахунок bbox"""
+        canvas._sr_pending = False
+        
+        def apply():
+            canvas._sr_pending = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_configure(event=None):
+            if canvas._sr_pending:
+                return
+            canvas._sr_pending = True
+            canvas.after_idle(apply)
+        
+        frame.bind("<Configure>", on_configure)
     
     # Методи навігації
     def show_page(self, page_name):
@@ -2551,10 +3359,17 @@ class InstagramBotGUI:
         for page in self.pages.values():
             page.pack_forget()
         
-        # Показ вибраної сторінки
+        # Показ вибраної сторінки (з побудовою при першому зверненні)
+        if page_name not in self.pages and page_name in self._page_factories:
+            self.pages[page_name] = self._page_factories[page_name]()
         if page_name in self.pages:
             self.pages[page_name].pack(fill='both', expand=True)
         
+        if page_name == "run":
+            self.root.bind_all("<MouseWheel>", self._run_page_wheel)
+        else:
+            self.root.unbind_all("<MouseWheel>")
+        
         # Оновлення активної кнопки
         for btn_name, btn in self.nav_buttons.items():
             if btn_name == page_name:
@@ -2568,21 +3383,33 @@ class InstagramBotGUI:
         if page_name == "main":
             self.update_main_stats()
     
+    def invalidate(self, key):
+        """Позначення лічильника головної сторінки застарілим"""
+        self._stat_dirty.add(key)
+    
+    def _count_stat(self, key):
+        if key == 'accounts':
+            return len(self.accounts)
+        if key == 'targets':
+            return len(self.targets)
+        if key == 'chain':
+            return len(self.get_chain_data())
+        return self._texts_count
+    
     def update_main_stats(self):
-        """Оновлення статистики на головній сторінці"""
+        """Оновлення статистики на головній сторінці (лише змінені лічильники)"""
         try:
-            accounts_count = len(self.accounts)
-            targets_count = len(self.targets)
-            chain_count = len(self.pages["chain"].get_chain())
-            texts_count = len(self.texts.get('story_replies', [])) + len(self.texts.get('direct_messages', []))
-            
-            self.stat_labels["accounts_count"].configure(text=str(accounts_count))
-            self.stat_labels["targets_count"].configure(text=str(targets_count))
-            self.stat_labels["chain_count"].configure(text=str(chain_count))
-            self.stat_labels["texts_count"].configure(text=str(texts_count))
+            labels = self.stat_labels
+            cache = self._stat_cache
+            for key in tuple(self._stat_dirty):
+                text = str(self._count_stat(key))
+                if cache.get(key) != text:
+                    labels[f"{key}_count"].configure(text=text)
+                    cache[key] = text
+                self._stat_dirty.discard(key)
             
-        except Exception as e:
-            print(f"Помилка оновлення статистики: {e}")
+        except Exception:
+            logger.exception("Помилка оновлення статистики")
     
     def load_all_data(self):
         """Завантаження всіх збережених даних"""
@@ -2592,17 +3419,24 @@ class InstagramBotGUI:
             self.load_texts()
             self.load_browser_settings()
             self.update_main_stats()
-        except Exception as e:
-            print(f"Помилка завантаження даних: {e}")
+        except Exception:
+            logger.exception("Помилка завантаження даних")
     
     def on_closing(self):
         """Обробка закриття програми"""
-        if self.automation_manager and self.automation_manager.is_running():
+        running = self.automation_manager and self.automation_manager.is_running()
+        if running or self._fan_out_active:
             if messagebox.askyesno("Підтвердження", "Автоматизація активна. Зупинити і вийти?"):
-                self.stop_automation()
+                if running:
+                    self.stop_automation()
+                self._stop_fan_out()
+                self._flush_saves()
+                _WRITE_POOL.shutdown(wait=True)
                 self.root.destroy()
         else:
             if messagebox.askyesno("Підтвердження", "Закрити програму?"):
+                self._flush_saves()
+                _WRITE_POOL.shutdown(wait=True)
                 self.root.destroy()
 
 
@@ -2659,7 +3493,7 @@ class RealAutomationManager:
             print("🔧 Створення MultiWorkerManager...")
             
             # Створення і запуск MultiWorkerManager
-            self.manager = MultiWorkerManager()
+            self.manager = _automation_engine().MultiWorkerManager()
             
             print("▶️ Запуск автоматизації через MultiWorkerManager...")
             self.manager.start_automation(multi_config, status_callback)